@@ -1,11 +1,42 @@
 # ruff: noqa: F403, F405, PTH, RUF012
 import argparse
+import functools
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
-from antigravity_architect.core.builder import AntigravityGenerator
-from antigravity_architect.core.engine import AntigravityEngine
 from antigravity_architect.resources.constants import *
-from antigravity_architect.resources.templates import *
+
+if TYPE_CHECKING:
+    from antigravity_architect.core.builder import AntigravityGenerator
+    from antigravity_architect.core.engine import AntigravityEngine
+
+# The generator/engine modules (and the regex tables, logging and subprocess machinery they pull in)
+# are bound by _load_core() in each entry point and in the helpers that use them, and the template
+# resources are imported inside the functions that use them, so --help, --version and
+# --list-keywords stay cheap.
+_LAZY_EXPORTS = {
+    "AntigravityEngine": "antigravity_architect.core.engine",
+    "AntigravityGenerator": "antigravity_architect.core.builder",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves the lazily imported core classes on first attribute access (PEP 562)."""
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _load_core() -> None:
+    """Binds the core classes as module globals, keeping any binding already in place (e.g. a mock)."""
+    namespace = globals()
+    for name in _LAZY_EXPORTS:
+        if name not in namespace:
+            namespace[name] = __getattr__(name)
 
 
 def build_cli_parser() -> argparse.ArgumentParser:
@@ -72,6 +103,9 @@ Examples:
     return parser
 
 
+# A stack naming none of these gets "linux" appended
+_OS_KEYWORDS = frozenset({"macos", "windows", "linux"})
+
 FILE_STACK_MAP = {
     "pyproject.toml": "python",
     "requirements.txt": "python",
@@ -163,18 +197,82 @@ def load_custom_templates(templates_path: str | None) -> dict[str, dict[str, str
         if category_dir.exists():
             import logging
 
-            for file_path in category_dir.glob("*.md"):
-                content = file_path.read_text(encoding="utf-8")
-                overrides[category][file_path.name] = content
-                logging.info(f"📦 Loaded custom template: {category}/{file_path.name}")
+            # scandir yields names and cached file types without building a Path per entry
+            with os.scandir(category_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        with open(entry.path, encoding="utf-8") as f:
+                            overrides[category][entry.name] = f.read()
+                        logging.info(f"📦 Loaded custom template: {category}/{entry.name}")
 
     return overrides
 
 
-def _doctor_check_dir(base_dir: Path, dir_path: str, fix: bool) -> tuple[str | None, str | None, str | None]:
+def _snapshot_key(rel_path: str) -> str:
+    """Normalizes a relative path for snapshot lookups (case-folded on Windows, as the OS compares)."""
+    return os.path.normcase(rel_path)
+
+
+def _folds_case(directory: Path) -> bool:
+    """
+    Probes whether the volume holding ``directory`` ignores case in names.
+
+    A case-swapped spelling of the directory (or, failing that, of its first
+    cased entry) resolving to the same file means lookups ignore case there.
+    Names without cased letters give no answer and read as case-sensitive.
+    """
+    candidates = [directory]
+    if directory.name.swapcase() == directory.name:
+        try:
+            with os.scandir(directory) as entries:
+                candidates = [Path(e.path) for e in entries if e.name.swapcase() != e.name][:1]
+        except OSError:
+            return False
+    for path in candidates:
+        swapped = path.with_name(path.name.swapcase())
+        if swapped.name == path.name:
+            continue
+        try:
+            return os.path.samefile(path, swapped)
+        except OSError:
+            return False
+    return False
+
+
+def _snapshot_paths(base_dir: Path, rel_paths: list[str]) -> dict[str, int] | None:
+    """
+    Maps every entry in the parent directories of ``rel_paths`` to its size.
+
+    Each parent is listed once with ``os.scandir``, so the doctor checks answer
+    existence and emptiness from this dict instead of stat-ing every path.
+    Missing parents contribute nothing, which reads as "missing" downstream.
+    Returns None on a case-insensitive volume that ``os.path.normcase`` does not
+    fold for (e.g. default APFS), so callers fall back to per-path checks.
+    """
+    if os.path.normcase("A") == "A" and _folds_case(base_dir):
+        return None
+    snapshot: dict[str, int] = {}
+    for parent in sorted({p.rpartition("/")[0] for p in rel_paths}):
+        try:
+            with os.scandir(base_dir / parent) as entries:
+                for entry in entries:
+                    try:
+                        key = _snapshot_key(f"{parent}/{entry.name}" if parent else entry.name)
+                        snapshot[key] = entry.stat().st_size
+                    except OSError:
+                        continue  # Broken symlink: treated like Path.exists() would, as missing
+        except OSError:
+            continue
+    return snapshot
+
+
+def _doctor_check_dir(
+    base_dir: Path, dir_path: str, fix: bool, snapshot: dict[str, int] | None = None
+) -> tuple[str | None, str | None, str | None]:
     """Checks directory existence and optionally fixes it."""
     full_path = base_dir / dir_path
-    if full_path.exists():
+    exists = _snapshot_key(dir_path) in snapshot if snapshot is not None else full_path.exists()
+    if exists:
         return f"✅ {dir_path}/ exists", None, None
 
     msg = f"❌ Missing: {dir_path}/"
@@ -187,24 +285,41 @@ def _doctor_check_dir(base_dir: Path, dir_path: str, fix: bool) -> tuple[str | N
 
 
 def _doctor_check_file(
-    base_dir: Path, file_path: str, template: str | None, fix: bool, optional: bool = False
+    base_dir: Path,
+    file_path: str,
+    template: str | None,
+    fix: bool,
+    optional: bool = False,
+    snapshot: dict[str, int] | None = None,
 ) -> tuple[str | None, str | None, str | None, str | None]:
     """Checks file health and optionally fixes it."""
+    _load_core()
     full_path = base_dir / file_path
-    is_missing = not full_path.exists()
-    is_empty = full_path.exists() and full_path.stat().st_size == 0
+    if snapshot is not None:
+        key = _snapshot_key(file_path)
+        is_missing = key not in snapshot
+        is_empty = snapshot.get(key) == 0
+    else:
+        # One stat answers both questions
+        try:
+            is_empty = full_path.stat().st_size == 0
+            is_missing = False
+        except (FileNotFoundError, NotADirectoryError):
+            is_missing, is_empty = True, False
     actual_content = "" if is_missing else full_path.read_text(encoding="utf-8")
 
     passed, warning, issue, fixed_msg = None, None, None, None
 
     # Phase 11: Diff-Based Doctor Reports (Drift Detection)
-    if not is_missing and template:
-        actual_hash = AntigravityEngine._get_checksum(actual_content)
-        expected_hash = AntigravityEngine._get_checksum(template)
-        if actual_hash != expected_hash:
-            warning = f"⚠️  Drift: {file_path} differs from template"
-            print(f"\n🔍 Drift Detail: {file_path}")
-            print(AntigravityEngine.get_diff(actual_content, template))
+    # Normalized text equality is what matching checksums implies, without hashing both sides
+    if (
+        not is_missing
+        and template
+        and AntigravityEngine._normalize_content(actual_content) != AntigravityEngine._normalize_content(template)
+    ):
+        warning = f"⚠️  Drift: {file_path} differs from template"
+        print(f"\n🔍 Drift Detail: {file_path}")
+        print(AntigravityEngine.get_diff(actual_content, template))
 
     if not is_missing and not is_empty and not warning:
         return f"✅ {file_path} matches canonical protocol", None, None, None
@@ -229,12 +344,22 @@ def _doctor_check_file(
 
 def _get_doctor_requirements() -> tuple[list[str], dict[str, tuple[str, str]]]:
     """Returns required directories and files for doctor check."""
-    dirs = [
+    # Copies, so callers can't mutate the cached tables
+    dirs, files = _doctor_requirements()
+    return list(dirs), dict(files)
+
+
+@functools.cache
+def _doctor_requirements() -> tuple[tuple[str, ...], dict[str, tuple[str, str]]]:
+    """Builds the required directory and file tables once per process."""
+    from antigravity_architect.resources.templates import AGENT_RULES, AGENT_WORKFLOWS
+
+    dirs = (
         ".agent/rules",
         ".agent/workflows",
         ".agent/skills",
         ".agent/memory",
-    ]
+    )
 
     files = {
         f".agent/rules/{RULE_IDENTITY}": (
@@ -268,11 +393,13 @@ def _get_doctor_optional_files() -> dict[str, tuple[str, str]]:
     return dict.fromkeys(files, ("Optional project file", ""))
 
 
-def _validate_doctor_dirs(base_dir: Path, dirs: list[str], fix: bool) -> tuple[list[str], list[str], list[str]]:
+def _validate_doctor_dirs(
+    base_dir: Path, dirs: list[str], fix: bool, snapshot: dict[str, int] | None = None
+) -> tuple[list[str], list[str], list[str]]:
     """Validates and fixes directories."""
     passed, issues, fixed = [], [], []
     for d in dirs:
-        p, i, f = _doctor_check_dir(base_dir, d, fix)
+        p, i, f = _doctor_check_dir(base_dir, d, fix, snapshot)
         if p:
             passed.append(p)
         if i:
@@ -283,13 +410,13 @@ def _validate_doctor_dirs(base_dir: Path, dirs: list[str], fix: bool) -> tuple[l
 
 
 def _validate_doctor_files(
-    base_dir: Path, files: dict[str, tuple[str, str]], fix: bool
+    base_dir: Path, files: dict[str, tuple[str, str]], fix: bool, snapshot: dict[str, int] | None = None
 ) -> tuple[list[str], list[str], list[str], list[str]]:
     """Validates and fixes files."""
     passed, warnings, issues, fixed = [], [], [], []
     for f_path, (_, tmpl) in files.items():
         is_optional = False
-        p, w, i, f = _doctor_check_file(base_dir, f_path, tmpl, fix, optional=is_optional)
+        p, w, i, f = _doctor_check_file(base_dir, f_path, tmpl, fix, optional=is_optional, snapshot=snapshot)
         if p:
             passed.append(p)
         if w:
@@ -302,33 +429,28 @@ def _validate_doctor_files(
 
 
 def _print_doctor_results(passed: list[str], warnings: list[str], issues: list[str], fixed: list[str]) -> None:
-    """Prints the results of the doctor check."""
-    print(SEPARATOR)
-    print(f"Summary: {len(passed)} passed, {len(warnings)} warnings, {len(issues)} issues")
-
-    if fixed:
-        print("\n🔧 Fixes Applied:")
-        for fix_msg in fixed:
-            print(f"  {fix_msg}")
+    """Prints the results of the doctor check as a single write."""
+    lines = [SEPARATOR, f"Summary: {len(passed)} passed, {len(warnings)} warnings, {len(issues)} issues"]
 
-    if issues:
-        print("\n🚨 Issues Found:")
-        for issue in issues:
-            print(f"  {issue}")
+    for heading, messages in (
+        ("\n🔧 Fixes Applied:", fixed),
+        ("\n🚨 Issues Found:", issues),
+        ("\n⚠️  Warnings:", warnings),
+    ):
+        if messages:
+            lines.append(heading)
+            lines.extend(f"  {msg}" for msg in messages)
 
-    if warnings:
-        print("\n⚠️  Warnings:")
-        for warning in warnings:
-            print(f"  {warning}")
-
-    print(f"\n{SEPARATOR}")
+    lines.append(f"\n{SEPARATOR}")
+    print("\n".join(lines))
 
 
 def doctor_project(project_path: str, fix: bool = False) -> bool:
     """
     Validates the integrity of an Antigravity project.
     """
-    base_dir = Path(project_path).resolve()
+    _load_core()
+    base_dir = Path(os.path.abspath(project_path))
     print(f"\n🩺 Running Doctor on: {project_path}")
     print(SEPARATOR)
 
@@ -360,20 +482,22 @@ def doctor_project(project_path: str, fix: bool = False) -> bool:
         issues.append(err)
 
     req_dirs, req_files = _get_doctor_requirements()
+    opt_files = _get_doctor_optional_files()
+    # One directory listing per parent instead of a stat per checked path
+    snapshot = _snapshot_paths(base_dir, [*req_dirs, *req_files, *opt_files])
 
-    d_passed, d_issues, d_fixed = _validate_doctor_dirs(base_dir, req_dirs, fix)
+    d_passed, d_issues, d_fixed = _validate_doctor_dirs(base_dir, req_dirs, fix, snapshot)
     passed.extend(d_passed)
     issues.extend(d_issues)
     fixed.extend(d_fixed)
 
-    f_passed, f_warnings, f_issues, f_fixed = _validate_doctor_files(base_dir, req_files, fix)
+    f_passed, f_warnings, f_issues, f_fixed = _validate_doctor_files(base_dir, req_files, fix, snapshot)
     passed.extend(f_passed)
     warnings.extend(f_warnings)
     issues.extend(f_issues)
     fixed.extend(f_fixed)
 
-    opt_files = _get_doctor_optional_files()
-    o_passed, o_warnings, o_issues, o_fixed = _validate_doctor_files(base_dir, opt_files, fix)
+    o_passed, o_warnings, o_issues, o_fixed = _validate_doctor_files(base_dir, opt_files, fix, snapshot)
     passed.extend(o_passed)
     warnings.extend(o_warnings)
     issues.extend(o_issues)
@@ -398,8 +522,7 @@ def doctor_project(project_path: str, fix: bool = False) -> bool:
 
 def list_keywords() -> None:
     """Display all supported tech stack keywords."""
-    print("\n🛠 Supported Tech Stack Keywords")
-    print(SEPARATOR)
+    lines = ["\n🛠 Supported Tech Stack Keywords", SEPARATOR]
 
     categories = {
         "Languages": ["python", "node", "javascript", "rust", "go", "java", "php", "ruby"],
@@ -410,15 +533,17 @@ def list_keywords() -> None:
     }
 
     for category, keywords in categories.items():
-        print(f"\n{category}:")
-        print(f"  {', '.join(keywords)}")
+        lines.append(f"\n{category}:")
+        lines.append(f"  {', '.join(keywords)}")
 
-    print("\n" + SEPARATOR)
-    print("Usage: --stack python,react,docker")
+    lines.append("\n" + SEPARATOR)
+    lines.append("Usage: --stack python,react,docker")
+    print("\n".join(lines))
 
 
 def list_blueprints() -> None:
     """Display all available built-in and marketplace blueprints."""
+    _load_core()
     print("\n💎 Blueprints Index (Local + Marketplace)")
     print(SEPARATOR)
 
@@ -433,10 +558,11 @@ def list_blueprints() -> None:
 
 def run_interactive_mode() -> None:
     """Original interactive mode for backwards compatibility."""
-    print(SEPARATOR)
-    print(f"   🌌 Antigravity Architect v{VERSION}")
-    print("   Dynamic Parsing | Knowledge Distribution | Universal")
-    print(SEPARATOR)
+    _load_core()
+    print(
+        f"{SEPARATOR}\n   🌌 Antigravity Architect v{VERSION}\n"
+        f"   Dynamic Parsing | Knowledge Distribution | Universal\n{SEPARATOR}"
+    )
 
     AntigravityEngine.setup_logging()
 
@@ -455,7 +581,7 @@ def run_interactive_mode() -> None:
         k_in = input("Keywords: ")
         manual_keywords = AntigravityEngine.parse_keywords(k_in)
 
-        if not any(x in manual_keywords for x in ("macos", "windows", "linux")):
+        if _OS_KEYWORDS.isdisjoint(manual_keywords):
             manual_keywords.append("linux")
 
     print("\nLicense (mit, apache, gpl):")
@@ -464,22 +590,23 @@ def run_interactive_mode() -> None:
     AntigravityGenerator.generate_project(project_name, manual_keywords, brain_dump_path, license_type=license_choice)
 
 
-def _print_dry_run_header(project_name: str, keywords: list[str], args: argparse.Namespace) -> None:
-    """Prints the dry run header summary."""
-    print("\n🔍 DRY RUN MODE - No files will be created")
-    print("=" * 60)
-    print(f"📦 Project Name: {project_name}")
-    print(f"⚙️  Tech Stack: {', '.join(keywords)}")
-    print(f"🧠 Brain Dump: {args.brain_dump or 'None'}")
-    print(f"🛡️  Safe Mode: {args.safe}")
-    print(f"📁 Templates: {args.templates or 'Default (Built-in)'}")
-    print(f"📜 License: {args.license}")
-    print("=" * 60)
+def _dry_run_header_lines(project_name: str, keywords: list[str], args: argparse.Namespace) -> list[str]:
+    """Dry run header summary."""
+    return [
+        "\n🔍 DRY RUN MODE - No files will be created",
+        "=" * 60,
+        f"📦 Project Name: {project_name}",
+        f"⚙️  Tech Stack: {', '.join(keywords)}",
+        f"🧠 Brain Dump: {args.brain_dump or 'None'}",
+        f"🛡️  Safe Mode: {args.safe}",
+        f"📁 Templates: {args.templates or 'Default (Built-in)'}",
+        f"📜 License: {args.license}",
+        "=" * 60,
+    ]
 
 
-def _print_dry_run_directories(project_name: str) -> None:
-    """Prints directories to be created."""
-    print("\n📁 Directories that would be created:")
+def _dry_run_directory_lines(project_name: str) -> list[str]:
+    """Directories to be created."""
     dirs = [
         "src",
         "tests",
@@ -492,13 +619,12 @@ def _print_dry_run_directories(project_name: str) -> None:
         ".agent/skills/secrets_manager",
         ".agent/memory",
     ]
-    for d in dirs:
-        print(f"    📂 {project_name}/{d}/")
+    prefix = f"    📂 {project_name}/"
+    return ["\n📁 Directories that would be created:", *(prefix + d + "/" for d in dirs)]
 
 
-def _print_dry_run_files(project_name: str, keywords: list[str]) -> None:
-    """Prints core files to be created."""
-    print("\n📄 Core Files that would be created:")
+def _dry_run_file_lines(project_name: str, keywords: list[str]) -> list[str]:
+    """Core files to be created."""
     core_files = [
         ".gitignore",
         "README.md",
@@ -511,40 +637,38 @@ def _print_dry_run_files(project_name: str, keywords: list[str]) -> None:
         BOOTSTRAP_FILE,
         ".env.example",
     ]
-    for f in core_files:
-        print(f"    📄 {project_name}/{f}")
-
-    print("\n🤖 AI IDE Configuration Files:")
     ide_files = [
         (".github/copilot-instructions.md", f"Tech Stack: {', '.join(keywords)}"),
     ]
-    for f, desc in ide_files:
-        print(f"    🤖 {project_name}/{f} ({desc})")
-
-
-def _print_dry_run_agent(keywords: list[str]) -> None:
-    """Prints agent-specific files."""
-    print("\n📜 Agent Rules & Workflows:")
-    for rule_file in AGENT_RULES:
-        print(f"    📜 .agent/rules/{rule_file}")
-    print(f"    📜 .agent/rules/01_tech_stack.md (Dynamic: {', '.join(keywords)})")
-    for workflow_file in AGENT_WORKFLOWS:
-        print(f"    ⚡ .agent/workflows/{workflow_file}")
-
-    print("\n📋 Project Standards & CI/CD:")
-    print("    📋 .github/workflows/ci.yml")
+    prefix = f"    📄 {project_name}/"
+    return [
+        "\n📄 Core Files that would be created:",
+        *(prefix + f for f in core_files),
+        "\n🤖 AI IDE Configuration Files:",
+        *(f"    🤖 {project_name}/{f} ({desc})" for f, desc in ide_files),
+    ]
 
-    print("\n🛠️  Agent Skills (.agent/skills/):")
-    for skill_file in AGENT_SKILLS:
-        print(f"    🛠️  {skill_file}")
 
-    print("\n🧠 Agent Memory (.agent/memory/):")
-    print("    🧠 scratchpad.md")
+def _dry_run_agent_lines(keywords: list[str]) -> list[str]:
+    """Agent-specific files."""
+    from antigravity_architect.resources.templates import AGENT_RULES, AGENT_SKILLS, AGENT_WORKFLOWS
+
+    return [
+        "\n📜 Agent Rules & Workflows:",
+        *("    📜 .agent/rules/" + rule_file for rule_file in AGENT_RULES),
+        f"    📜 .agent/rules/01_tech_stack.md (Dynamic: {', '.join(keywords)})",
+        *("    ⚡ .agent/workflows/" + workflow_file for workflow_file in AGENT_WORKFLOWS),
+        "\n📋 Project Standards & CI/CD:",
+        "    📋 .github/workflows/ci.yml",
+        "\n🛠️  Agent Skills (.agent/skills/):",
+        *("    🛠️  " + skill_file for skill_file in AGENT_SKILLS),
+        "\n🧠 Agent Memory (.agent/memory/):",
+        "    🧠 scratchpad.md",
+    ]
 
 
-def _print_dry_run_templates() -> None:
-    """Prints template files."""
-    print("\n📋 GitHub Templates (.github/):")
+def _dry_run_template_lines() -> list[str]:
+    """Template files."""
     github_files = [
         "ISSUE_TEMPLATE/bug_report.md",
         "ISSUE_TEMPLATE/feature_request.md",
@@ -553,28 +677,29 @@ def _print_dry_run_templates() -> None:
         "PULL_REQUEST_TEMPLATE.md",
         "FUNDING.yml",
     ]
-    for f in github_files:
-        print(f"    📋 {f}")
+    return ["\n📋 GitHub Templates (.github/):", *("    📋 " + f for f in github_files)]
 
 
 def _print_dry_run_report(project_name: str, keywords: list[str], args: argparse.Namespace) -> None:
-    """Helper to print dry run details."""
-    _print_dry_run_header(project_name, keywords, args)
-    _print_dry_run_directories(project_name)
-    _print_dry_run_files(project_name, keywords)
-    _print_dry_run_agent(keywords)
-    _print_dry_run_templates()
-
-    print("\n" + "=" * 60)
-    print("✅ Dry run complete. No changes made.")
-    print("   Run without --dry-run to create the project.")
+    """Helper to print dry run details, emitted as a single write."""
+    lines = [
+        *_dry_run_header_lines(project_name, keywords, args),
+        *_dry_run_directory_lines(project_name),
+        *_dry_run_file_lines(project_name, keywords),
+        *_dry_run_agent_lines(keywords),
+        *_dry_run_template_lines(),
+        "\n" + "=" * 60,
+        "✅ Dry run complete. No changes made.",
+        "   Run without --dry-run to create the project.",
+    ]
+    print("\n".join(lines))
 
 
 def run_cli_mode(args: argparse.Namespace) -> None:
     """Run in CLI mode with provided arguments."""
-    print("=========================================================")
-    print(f"   🌌 Antigravity Architect v{VERSION} (CLI Mode)")
-    print("=========================================================")
+    _load_core()
+    banner = "========================================================="
+    print(f"{banner}\n   🌌 Antigravity Architect v{VERSION} (CLI Mode)\n{banner}")
 
     AntigravityEngine.setup_logging()
 
@@ -603,7 +728,7 @@ def run_cli_mode(args: argparse.Namespace) -> None:
                 keywords = cwd_stack
                 print(f"📂 Detected stack from current directory: {', '.join(keywords)}")
 
-    if not any(x in keywords for x in ("macos", "windows", "linux")):
+    if _OS_KEYWORDS.isdisjoint(keywords):
         keywords.append("linux")
 
     if args.dry_run:
@@ -631,8 +756,35 @@ def run_cli_mode(args: argparse.Namespace) -> None:
     )
 
 
+def _run_fast_path(argv: list[str]) -> bool:
+    """
+    Handles a lone informational flag without building any parser.
+
+    Anything else (including --help or combined flags) returns False and goes
+    through the full parser so validation and presets behave as before.
+    """
+    if len(argv) != 1:
+        return False
+    flag = argv[0]
+    if flag == "--list-keywords":
+        list_keywords()
+    elif flag == "--list-blueprints":
+        list_blueprints()
+    elif flag == "--version":
+        # Same output and exit status as argparse's version action
+        print(f"antigravity-architect {VERSION}")
+        sys.exit(0)
+    else:
+        return False
+    return True
+
+
 def main(argv: list[str] | None = None) -> None:
     """Main entry point for the Antigravity Architect."""
+    if _run_fast_path(sys.argv[1:] if argv is None else argv):
+        return
+    _load_core()
+
     pre_parser = argparse.ArgumentParser(add_help=False)
     pre_parser.add_argument("--preset", type=str)
     pre_parser.add_argument("--list-presets", action="store_true")
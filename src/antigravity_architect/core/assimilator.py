@@ -1,12 +1,59 @@
 import logging
 import os
 import re
+from collections import Counter, defaultdict
 
 from antigravity_architect.core.engine import AntigravityEngine
 from antigravity_architect.resources.constants import AGENT_DIR, CLASSIFICATION_RULES, TECH_ALIASES
 from antigravity_architect.resources.templates import GITIGNORE_MAP
 
 
+# --- Precompiled Tech Detection ---
+def _build_tech_implications() -> dict[str, frozenset[str]]:
+    """Maps every detectable word (primary key or alias) to the primary keys it implies."""
+    direct: dict[str, set[str]] = {k: {k} for k in set(GITIGNORE_MAP) | set(TECH_ALIASES)}
+    for primary, aliases in TECH_ALIASES.items():
+        for alias in aliases:
+            direct.setdefault(alias, set()).add(primary)
+    return {word: frozenset(primaries) for word, primaries in direct.items()}
+
+
+_TECH_IMPLIES = _build_tech_implications()
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirrors regex \\w for the boundary checks in _find_word."""
+    return char.isalnum() or char == "_"
+
+
+def _find_word(text: str, word: str) -> bool:
+    """True if ``word`` occurs in ``text`` on word boundaries (str.find plus a neighbour check)."""
+    end = len(text)
+    i = text.find(word)
+    while i != -1:
+        after = i + len(word)
+        if (i == 0 or not _is_word_char(text[i - 1])) and (after == end or not _is_word_char(text[after])):
+            return True
+        i = text.find(word, i + 1)
+    return False
+
+
+# Markdown header lines that start a Brain Dump section
+_HEADER_RE = re.compile(r"^#+\s+.*$", re.MULTILINE)
+
+# --- Precompiled Classifier ---
+# One scanner with a named group per category; match.lastgroup names the category hit.
+# Keywords within a group are longest first so a shorter keyword never shadows a longer one.
+_CATEGORY_SCANNER = re.compile(
+    r"\b(?:"
+    + "|".join(
+        f"(?P<{cat}>" + "|".join(re.escape(k) for k in sorted(kws, key=len, reverse=True)) + ")"
+        for cat, kws in CLASSIFICATION_RULES.items()
+    )
+    + r")\b"
+)
+
+
 class AntigravityAssimilator:
     """
     Intelligent brain dump parsing and knowledge distribution.
@@ -17,27 +64,25 @@ class AntigravityAssimilator:
     All methods are static as they don't require instance state.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def detect_tech_stack(text: str) -> list[str]:
         """
         Intelligently detects technology keywords using primary keys and aliases.
         """
-        detected = set()
-        text_lower = text.lower()
-
-        # Check primary keywords from mappings
-        primary_sources = set(GITIGNORE_MAP.keys()) | set(TECH_ALIASES.keys())
+        return AntigravityAssimilator.detect_tech_stack_lower(text.lower())
 
-        for k in primary_sources:
-            if re.search(r"\b" + re.escape(k) + r"\b", text_lower):
-                detected.add(k)
+    @staticmethod
+    def detect_tech_stack_lower(text_lower: str) -> list[str]:
+        """detect_tech_stack for text the caller has already lowercased."""
+        detected: set[str] = set()
 
-        # Check aliases for deeper detection
-        for primary, aliases in TECH_ALIASES.items():
-            for alias in aliases:
-                if re.search(r"\b" + re.escape(alias) + r"\b", text_lower):
-                    detected.add(primary)
-                    break
+        # Every detectable word is a short literal: a C-level find per word stops at its first
+        # bounded hit, which beats one regex alternation over large dumps
+        for word, primaries in _TECH_IMPLIES.items():
+            if _find_word(text_lower, word):
+                detected |= primaries
 
         return list(detected)
 
@@ -46,13 +91,15 @@ class AntigravityAssimilator:
         """
         Generates a deep-dive TECH_STACK.md based on detected keywords and text analysis.
         """
-        content = "# 🛠️ Technical Stack Deep-Dive\n\n"
-        content += "## 🚀 Primary Technologies\n"
-        for k in sorted(keywords):
-            content += f"- **{k.title()}**\n"
+        return AntigravityAssimilator.build_tech_deep_dive_lower(keywords, full_text.lower())
 
-        content += "\n## 🔍 Contextual Observations\n"
-        text_lower = full_text.lower()
+    @staticmethod
+    def build_tech_deep_dive_lower(keywords: list[str], text_lower: str) -> str:
+        """build_tech_deep_dive for text the caller has already lowercased."""
+        parts = ["# 🛠️ Technical Stack Deep-Dive\n\n", "## 🚀 Primary Technologies\n"]
+        parts.extend(f"- **{k.title()}**\n" for k in sorted(keywords))
+
+        parts.append("\n## 🔍 Contextual Observations\n")
 
         observation_map = {
             "architecture": "Structural architectural specifications detected.",
@@ -70,26 +117,26 @@ class AntigravityAssimilator:
                 observations.add(obs)
 
         if observations:
-            for obs in sorted(observations):
-                content += f"- {obs}\n"
+            parts.extend(f"- {obs}\n" for obs in sorted(observations))
         else:
-            content += "- Standard project structure with generic tech stack.\n"
+            parts.append("- Standard project structure with generic tech stack.\n")
 
-        content += "\n## ⚠️ Technical Debt & Tracking\n"
+        parts.append("\n## ⚠️ Technical Debt & Tracking\n")
         debt_keywords = ["todo", "fixme", "refactor", "deprecated", "legacy", "optimization needed"]
         debts = [k for k in debt_keywords if k in text_lower]
 
         if debts:
-            content += "Potential technical debt or optimization areas identified:\n"
-            for d in debts:
-                content += f"- {d.title()}\n"
+            parts.append("Potential technical debt or optimization areas identified:\n")
+            parts.extend(f"- {d.title()}\n" for d in debts)
         else:
-            content += "No immediate technical debt keywords identified in source documents.\n"
+            parts.append("No immediate technical debt keywords identified in source documents.\n")
 
-        content += "\n## 🤖 Agent Interaction Map\n"
-        content += "Agents should prioritize rules in `.agent/rules/` and use `TECH_STACK.md` as the primary architectural reference.\n"
+        parts.append("\n## 🤖 Agent Interaction Map\n")
+        parts.append(
+            "Agents should prioritize rules in `.agent/rules/` and use `TECH_STACK.md` as the primary architectural reference.\n"
+        )
 
-        return content
+        return "".join(parts)
 
     @staticmethod
     def identify_category(text: str) -> str:
@@ -98,28 +145,28 @@ class AntigravityAssimilator:
 
         Returns the category with the highest keyword match score.
         """
-        text_lower = text.lower()
-        scores: dict[str, int] = dict.fromkeys(CLASSIFICATION_RULES, 0)
+        return AntigravityAssimilator.identify_category_lower(text.lower())
 
-        for category, keywords in CLASSIFICATION_RULES.items():
-            for k in keywords:
-                scores[category] += len(re.findall(r"\b" + re.escape(k) + r"\b", text_lower))
+    @staticmethod
+    def identify_category_lower(text_lower: str) -> str:
+        """identify_category for text the caller has already lowercased."""
+        # Seed in rule order so ties still resolve to the first category
+        scores: Counter[str] = Counter(dict.fromkeys(CLASSIFICATION_RULES, 0))
+        scores.update(m.lastgroup for m in _CATEGORY_SCANNER.finditer(text_lower) if m.lastgroup)
 
-        best_cat = max(scores, key=lambda x: scores[x])
-        if scores[best_cat] == 0:
-            return "docs"
-        return best_cat
+        # most_common(1) returns the first maximal entry, i.e. the earliest category on a tie
+        best_cat, best_score = scores.most_common(1)[0]
+        return best_cat if best_score else "docs"
 
     @staticmethod
     def get_destination_path(base_dir: str, category: str, safe_title: str) -> str:
         """Determines the file destination based on category."""
-        category_paths: dict[str, str] = {
-            "rules": os.path.join(base_dir, AGENT_DIR, "rules", f"imported_{safe_title}.md"),
-            "workflows": os.path.join(base_dir, AGENT_DIR, "workflows", f"imported_{safe_title}.md"),
-            "skills": os.path.join(base_dir, AGENT_DIR, "skills", f"imported_{safe_title}", "SKILL.md"),
-            "docs": os.path.join(base_dir, "docs", "imported", f"{safe_title}.md"),
-        }
-        return category_paths.get(category, category_paths["docs"])
+        # Only the chosen destination is joined; unknown categories fall back to docs
+        if category in ("rules", "workflows"):
+            return os.path.join(base_dir, AGENT_DIR, category, f"imported_{safe_title}.md")
+        if category == "skills":
+            return os.path.join(base_dir, AGENT_DIR, "skills", f"imported_{safe_title}", "SKILL.md")
+        return os.path.join(base_dir, "docs", "imported", f"{safe_title}.md")
 
     @staticmethod
     def process_brain_dump(filepath: str | None, base_dir: str) -> list[str]:
@@ -147,32 +194,47 @@ class AntigravityAssimilator:
         raw_dest = os.path.join(base_dir, "context", "raw", "master_brain_dump.md")
         AntigravityEngine.write_file(raw_dest, full_text, exist_ok=True)
 
+        # Lowercase once; stack detection, the deep-dive and classification all scan this copy
+        full_lower = full_text.lower()
+
         # 2. Extract Tech Stack Keywords
-        detected_keywords = AntigravityAssimilator.detect_tech_stack(full_text)
+        detected_keywords = AntigravityAssimilator.detect_tech_stack_lower(full_lower)
         logging.info(f"🔍 Detected Tech Stack from Source: {', '.join(detected_keywords)}")
 
         # 3. Generate TECH_STACK.md (The Documentation Genie)
         tech_stack_path = os.path.join(base_dir, "docs", "TECH_STACK.md")
-        tech_stack_content = AntigravityAssimilator.build_tech_deep_dive(detected_keywords, full_text)
+        tech_stack_content = AntigravityAssimilator.build_tech_deep_dive_lower(detected_keywords, full_lower)
         AntigravityEngine.write_file(tech_stack_path, tech_stack_content, exist_ok=True)
 
         # 4. Split & Distribute
-        sections = re.split(r"(^#+\s+.*$)", full_text, flags=re.MULTILINE)
-
-        for i in range(1, len(sections), 2):
-            if i + 1 >= len(sections):
-                break
-            header = sections[i].strip()
-            content = sections[i + 1].strip()
-            if not content:
-                continue
-
-            category = AntigravityAssimilator.identify_category(header + "\n" + content)
-            safe_title = AntigravityEngine.slugify_title(header)
+        # Classification slices the lowered copy; slices line up unless case folding changed lengths
+        lower_aligned = len(full_lower) == len(full_text)
+
+        # Each section runs from the end of its header to the start of the next one
+        matches = list(_HEADER_RE.finditer(full_text))
+        sections: list[tuple[int, int, str, str]] = []
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(full_text)
+            content = full_text[match.end() : end].strip()
+            if content:
+                sections.append((match.start(), end, match.group().strip(), content))
+
+        # Slug every header in one batched pass
+        slugs = AntigravityEngine.slugify_titles([header for _, _, header, _ in sections])
+
+        # Sections bound for the same file are buffered and appended in one write per destination
+        pending: defaultdict[str, list[str]] = defaultdict(list)
+        for (start, end, header, content), safe_title in zip(sections, slugs, strict=True):
+            if lower_aligned:
+                category = AntigravityAssimilator.identify_category_lower(full_lower[start:end])
+            else:
+                category = AntigravityAssimilator.identify_category(header + "\n" + content)
             dest = AntigravityAssimilator.get_destination_path(base_dir, category, safe_title)
+            pending[dest].append(f"<!-- Auto-Assimilated Source -->\n\n{header}\n\n{content}")
 
-            formatted = f"<!-- Auto-Assimilated Source -->\n\n{header}\n\n{content}"
-            AntigravityEngine.append_file(dest, formatted)
+        # Joining on three newlines reproduces the "\n\n" + section + "\n" framing of per-section appends
+        for dest, chunks in pending.items():
+            AntigravityEngine.append_file(dest, "\n\n\n".join(chunks))
 
         logging.info("🧠 Assimilation Complete.")
         return detected_keywords
@@ -1,4 +1,5 @@
 # ruff: noqa: F403, F405, PTH, RUF012
+import functools
 import logging
 import os
 from datetime import datetime
@@ -10,6 +11,84 @@ from antigravity_architect.plugins.manager import PluginManager
 from antigravity_architect.resources.constants import *
 from antigravity_architect.resources.templates import *
 
+# Keywords without their own gitignore block that reuse another one
+_GITIGNORE_ALIASES = {"js": "node", "javascript": "node"}
+
+# Keyword -> gitignore block with aliases already resolved, so assembly is one lookup per keyword.
+# Keywords with an empty block (e.g. postgres) stay in GITIGNORE_MAP, whose keys double as the
+# detectable stack keywords, but are left out here so rendering never joins them.
+_GITIGNORE_BLOCKS: dict[str, str] = {
+    k: v
+    for k, v in {
+        **{alias: GITIGNORE_MAP[target] for alias, target in _GITIGNORE_ALIASES.items() if target in GITIGNORE_MAP},
+        **GITIGNORE_MAP,
+    }.items()
+    if v
+}
+
+# Prepared-bytes forms of the gitignore pieces; the blocks already end in a single newline.
+_GITIGNORE_BASE_BYTES = prepare_template(BASE_GITIGNORE)
+_GITIGNORE_BLOCK_BYTES = {k: v.encode("utf-8") for k, v in _GITIGNORE_BLOCKS.items()}
+
+# Static core-config payloads, prepared once
+_ENV_EXAMPLE_BYTES = prepare_template("API_KEY=\nDB_URL=")
+_BOOTSTRAP_GUIDE_BYTES = prepare_template(
+    """# Agent Start Guide
+
+1. **Protocol:** Review `.agent/manifest.json` for project structure.
+2. **Context:** Read `.agent/memory/scratchpad.md` and `.agent/memory/evolution.md`.
+3. **Safety:** Ensure `scripts/sentinel.py` is running for monitoring.
+4. **Action:** Use `/plan` to break down tasks or `/bootstrap` for code generation.
+5. **Standards:** Follow the v2.0.0 Agent Protocol in `.agent/rules/`.
+"""
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_gitignore(keywords: tuple[str, ...]) -> str:
+    """Assembles the .gitignore body once per distinct keyword sequence."""
+    blocks = _GITIGNORE_BLOCKS
+    return BASE_GITIGNORE + "".join([blocks[k] for k in keywords if k in blocks])
+
+
+@functools.lru_cache(maxsize=128)
+def _render_gitignore_bytes(keywords: tuple[str, ...]) -> bytes:
+    """Joins the prepared gitignore blocks in a single allocation, ready to write verbatim."""
+    blocks = _GITIGNORE_BLOCK_BYTES
+    return b"".join([_GITIGNORE_BASE_BYTES, *(blocks[k] for k in keywords if k in blocks)])
+
+
+@functools.lru_cache(maxsize=128)
+def _render_tech_stack_rule(keywords: tuple[str, ...]) -> str:
+    """Renders the tech stack rule once per keyword sequence (the listing keeps caller order)."""
+    return f"""# Technology Stack
+Keywords Detected: {", ".join(keywords)}
+
+## Directives
+1. **Source of Truth:** Always refer to `docs/TECH_STACK.md` for architectural deep-dives.
+2. **Inference:** Assume standard frameworks for these keywords (e.g., React implies standard hooks/components).
+3. **Tooling:** Use the standard CLI tools (pip, npm, cargo, go mod).
+4. **Files:** Look for `pyproject.toml`, `package.json`, or similar to confirm versions.
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_template(source: str) -> CompiledTemplate:
+    """Parses a lazily loaded str.format template once per process."""
+    return CompiledTemplate(source)
+
+
+@functools.lru_cache(maxsize=8)
+def _render_mit_license(year: int) -> bytes:
+    """Renders and prepares the MIT licence once per year."""
+    return prepare_template(_compile_template(LICENSE_TEMPLATES["mit"]).render(year=year, author="pkeffect"))
+
+
+@functools.lru_cache(maxsize=32)
+def _render_readme(project_name: str, tech_stack: str) -> bytes:
+    """Renders and prepares the README once per (project, stack) pair."""
+    return prepare_template(PROFESSIONAL_README_COMPILED.render(project_name=project_name, tech_stack=tech_stack))
+
 
 class AntigravityBuilder:
     """
@@ -20,35 +99,28 @@ class AntigravityBuilder:
     All methods are static as they don't require instance state.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def build_gitignore(keywords: list[str]) -> str:
         """Builds a .gitignore file based on detected technology keywords."""
-        content = BASE_GITIGNORE
-        for k in keywords:
-            if k in GITIGNORE_MAP:
-                content += GITIGNORE_MAP[k]
-            elif k in ("js", "javascript"):
-                content += GITIGNORE_MAP.get("node", "")
-        return content
+        return _render_gitignore(tuple(keywords))
+
+    @staticmethod
+    def build_gitignore_bytes(keywords: list[str]) -> bytes:
+        """Same content as build_gitignore, as prepared bytes for write_file."""
+        return _render_gitignore_bytes(tuple(keywords))
 
     @staticmethod
     def build_tech_stack_rule(keywords: list[str]) -> str:
         """Builds a dynamic tech stack rule for the agent."""
-        return f"""# Technology Stack
-Keywords Detected: {", ".join(keywords)}
-
-## Directives
-1. **Source of Truth:** Always refer to `docs/TECH_STACK.md` for architectural deep-dives.
-2. **Inference:** Assume standard frameworks for these keywords (e.g., React implies standard hooks/components).
-3. **Tooling:** Use the standard CLI tools (pip, npm, cargo, go mod).
-4. **Files:** Look for `pyproject.toml`, `package.json`, or similar to confirm versions.
-"""
+        return _render_tech_stack_rule(tuple(keywords))
 
     @staticmethod
-    def build_scratchpad(keywords: list[str], has_brain_dump: bool) -> str:
-        """Builds the initial scratchpad memory file."""
+    def build_scratchpad(keywords: list[str], has_brain_dump: bool, now: datetime | None = None) -> str:
+        """Builds the initial scratchpad memory file, stamped with `now` (defaults to the current time)."""
         return f"""# Project Scratchpad <!-- ID: scratchpad -->
-*Last Updated: {datetime.now().isoformat()}*
+*Last Updated: {(now or datetime.now()).isoformat()}*
 
 ## Status <!-- ID: project_status -->
 - Project initialized.
@@ -74,12 +146,12 @@ Keywords Detected: {", ".join(keywords)}
         if not files:
             return content + "_No documents imported yet._"
 
-        content += "## Assimilated Knowledge\n"
+        parts = [content, "## Assimilated Knowledge\n"]
         for f in files:
             if f.endswith(".md") and f != "INDEX.md":
                 title = f.replace(".md", "").replace("_", " ").title()
-                content += f"- [{title}]({f})\n"
-        return content
+                parts.append(f"- [{title}]({f})\n")
+        return "".join(parts)
 
     @staticmethod
     def build_architecture_diagram(project_name: str) -> str:
@@ -109,7 +181,7 @@ Keywords Detected: {", ".join(keywords)}
             logging.debug(f"Error scanning for siblings: {e}")
 
         sibling_str = "\n".join(siblings) if siblings else "_No sibling repositories detected in this scratch space._"
-        return LINKS_TEMPLATE.format(sibling_repos=sibling_str, knowledge_lake=knowledge_lake_str)
+        return LINKS_COMPILED.render(sibling_repos=sibling_str, knowledge_lake=knowledge_lake_str)
 
 
 class AntigravityGenerator:
@@ -121,6 +193,8 @@ class AntigravityGenerator:
     workflow from directory creation through file generation and brain dump processing.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def _calculate_token_budget(contents: list[str]) -> int:
         """Rough estimation of token count (chars / 4)."""
@@ -175,9 +249,11 @@ class AntigravityGenerator:
         safe_mode: bool = False,
         custom_templates: dict[str, dict[str, str]] | None = None,
         personality: str | None = None,
+        now: datetime | None = None,
     ) -> None:
         """Generates all .agent/ rules, workflows, and skills with adaptive intelligence."""
         custom = custom_templates or {"rules": {}, "workflows": {}, "skills": {}}
+        now = now or datetime.now()
 
         # Calculate token budget for all generated files
         all_contents = list(AGENT_RULES.values()) + list(AGENT_WORKFLOWS.values()) + list(AGENT_SKILLS.values())
@@ -185,12 +261,17 @@ class AntigravityGenerator:
         priority_rules = AntigravityGenerator._generate_priority_list(keywords)
 
         # Phase 12: High-Performance Parallel Generation
-        from concurrent.futures import ThreadPoolExecutor
+        write_queue: list[tuple[str, str | bytes]] = []
 
-        write_queue = []
+        # Subdirectory roots, joined once and reused for every file below
+        agent_dir = os.path.join(base_dir, AGENT_DIR)
+        rules_dir = os.path.join(agent_dir, "rules")
+        workflows_dir = os.path.join(agent_dir, "workflows")
+        skills_dir = os.path.join(agent_dir, "skills")
+        memory_dir = os.path.join(agent_dir, "memory")
 
         # v1.8.0 Adaptive Manifest
-        manifest_path = os.path.join(base_dir, AGENT_DIR, AGENT_MANIFEST)
+        manifest_path = os.path.join(agent_dir, AGENT_MANIFEST)
         import json
 
         manifest_data = {
@@ -200,7 +281,7 @@ class AntigravityGenerator:
             "stats": {
                 "token_budget_est": token_budget,
                 "rule_count": len(AGENT_RULES),
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": now.isoformat(),
             },
             "capabilities": {
                 "reasoning_tier": "3",
@@ -221,18 +302,24 @@ class AntigravityGenerator:
         write_queue.append((manifest_path, json.dumps(manifest_data, indent=2)))
 
         # Rule sets
-        for filename, content in AGENT_RULES.items():
-            path = os.path.join(base_dir, AGENT_DIR, "rules", filename)
-            final_content = custom.get("rules", {}).get(filename, content)
+        # Bundled templates go out as pre-encoded bytes; custom overrides stay text
+        rule_overrides = custom.get("rules", {})
+        for filename in AGENT_RULES:
+            path = os.path.join(rules_dir, filename)
+            final_content = rule_overrides[filename] if filename in rule_overrides else AGENT_RULES.prepared(filename)
             write_queue.append((path, final_content))
 
-        tech_stack_path = os.path.join(base_dir, AGENT_DIR, "rules", RULE_TECH_STACK)
+        tech_stack_path = os.path.join(rules_dir, RULE_TECH_STACK)
         write_queue.append((tech_stack_path, AntigravityBuilder.build_tech_stack_rule(keywords)))
 
         # Workflows
-        for filename, content in AGENT_WORKFLOWS.items():
-            path = os.path.join(base_dir, AGENT_DIR, "workflows", filename)
-            final_content = custom.get("workflows", {}).get(filename, content)
+        workflow_overrides = custom.get("workflows", {})
+        for filename in AGENT_WORKFLOWS:
+            path = os.path.join(workflows_dir, filename)
+            if filename in workflow_overrides:
+                final_content = workflow_overrides[filename]
+            else:
+                final_content = AGENT_WORKFLOWS.prepared(filename)
             write_queue.append((path, final_content))
 
         # Phase 17: Skill Chaining
@@ -283,11 +370,15 @@ class AntigravityGenerator:
             resolve_skill_deps("bridge")
 
         # Add resolved skills to write_queue
+        skill_overrides = custom.get("skills", {})
         for skill_name in final_skill_names:
             if skill_name in skill_contents:
-                for skill_path, content in skill_contents[skill_name]:
-                    path = os.path.join(base_dir, AGENT_DIR, "skills", skill_path)
-                    final_content = custom.get("skills", {}).get(skill_path, content)
+                for skill_path, _ in skill_contents[skill_name]:
+                    path = os.path.join(skills_dir, skill_path)
+                    if skill_path in skill_overrides:
+                        final_content = skill_overrides[skill_path]
+                    else:
+                        final_content = AGENT_SKILLS.prepared(skill_path)
                     write_queue.append((path, final_content))
 
         # Phase 17: Personality Packs
@@ -298,34 +389,27 @@ class AntigravityGenerator:
             elif personality == "enterprise":
                 personality_rule += "1. **Compliance:** Every change MUST have an ADR in `DECISIONS.md`.\n2. **Quality:** 100% test coverage mandatory for new features.\n"
 
-            personality_path = os.path.join(base_dir, AGENT_DIR, "rules", "personality.md")
+            personality_path = os.path.join(rules_dir, "personality.md")
             write_queue.append((personality_path, personality_rule))
 
         # Phase 20: Declarative Governance
-        for filename, content in AGENT_CONFIGS.items():
-            path = os.path.join(base_dir, AGENT_DIR, filename)
-            write_queue.append((path, content))
+        for filename in AGENT_CONFIGS:
+            write_queue.append((os.path.join(agent_dir, filename), AGENT_CONFIGS.prepared(filename)))
 
         # Memory & Protocols
-        for filename, content in AGENT_MEMORIES.items():
-            path = os.path.join(base_dir, AGENT_DIR, "memory", filename)
-            write_queue.append((path, content))
+        for filename in AGENT_MEMORIES:
+            write_queue.append((os.path.join(memory_dir, filename), AGENT_MEMORIES.prepared(filename)))
 
-        scratchpad_path = os.path.join(base_dir, AGENT_DIR, "memory", "scratchpad.md")
-        write_queue.append((scratchpad_path, AntigravityBuilder.build_scratchpad(keywords, False)))
-        write_queue.append((os.path.join(base_dir, AGENT_DIR, "memory", "graveyard.md"), GRAVEYARD_TEMPLATE))
-        write_queue.append((os.path.join(base_dir, AGENT_DIR, "memory", "evolution.md"), EVOLUTION_TEMPLATE))
+        scratchpad_path = os.path.join(memory_dir, "scratchpad.md")
+        write_queue.append((scratchpad_path, AntigravityBuilder.build_scratchpad(keywords, False, now)))
+        write_queue.append((os.path.join(memory_dir, "graveyard.md"), GRAVEYARD_TEMPLATE_BYTES))
+        write_queue.append((os.path.join(memory_dir, "evolution.md"), EVOLUTION_TEMPLATE_BYTES))
 
         # Sentinel
-        write_queue.append((os.path.join(base_dir, "scripts", "sentinel.py"), SENTINEL_PY))
+        write_queue.append((os.path.join(base_dir, "scripts", "sentinel.py"), SENTINEL_PY_BYTES))
 
         # EXECUTOR
-        def _execute_write(item: tuple[str, str]) -> None:
-            path, content = item
-            AntigravityEngine.write_file(path, content, exist_ok=safe_mode)
-
-        with ThreadPoolExecutor() as executor:
-            executor.map(_execute_write, write_queue)
+        AntigravityEngine.write_many(write_queue, exist_ok=safe_mode)
 
     @staticmethod
     def generate_ecosystem_files(
@@ -336,7 +420,7 @@ class AntigravityGenerator:
         project_name: str = "project",
     ) -> None:
         """Phase 13: IDE & CI Ecosystem - generates platform-specific configs."""
-        write_queue = []
+        write_queue: list[tuple[str, str | bytes]] = []
 
         # IDE Configs
         if ide == "jetbrains":
@@ -388,15 +472,7 @@ class AntigravityGenerator:
             )
 
         # Execute Parallel Writes
-        from concurrent.futures import ThreadPoolExecutor
-
-        def _execute_write(item: tuple[str, str]) -> None:
-            path, content = item
-            AntigravityEngine.write_file(path, content, exist_ok=True)
-
-        if write_queue:
-            with ThreadPoolExecutor() as executor:
-                executor.map(_execute_write, write_queue)
+        AntigravityEngine.write_many(write_queue, exist_ok=True)
 
     @staticmethod
     def _resolve_blueprint(blueprint: str | None) -> dict:
@@ -439,19 +515,21 @@ class AntigravityGenerator:
             "pyproject.toml": "Python (Poetry/Ruff)",
         }
 
-        found = False
         for file, lang in mapping.items():
             if (base / file).exists():
                 deps.append(f"- **{file}**: Detects {lang} ecosystem.")
-                found = True
 
-        if not found:
+        if not deps:
             return
 
-        content = "# 📦 Project Dependency Manifest\n\n"
-        content += "This project uses the following package managers and dependency definitions:\n\n"
-        content += "\n".join(deps)
-        content += "\n\n---\n*Generated by Antigravity v1.8.0 Dependency Awareness Protocol*"
+        content = "".join(
+            [
+                "# 📦 Project Dependency Manifest\n\n",
+                "This project uses the following package managers and dependency definitions:\n\n",
+                "\n".join(deps),
+                "\n\n---\n*Generated by Antigravity v1.8.0 Dependency Awareness Protocol*",
+            ]
+        )
 
         AntigravityEngine.write_file(os.path.join(base_dir, "docs", "DEPENDENCIES.md"), content, exist_ok=True)
 
@@ -499,18 +577,19 @@ class AntigravityGenerator:
     @staticmethod
     def generate_community_standards(base_dir: str, safe_mode: bool = False) -> None:
         """Generates standard legal and community files."""
-        files = {
-            CHANGELOG_FILE: CHANGELOG_TEMPLATE,
-            CONTRIBUTING_FILE: CONTRIBUTING_TEMPLATE,
-            AUDIT_FILE: AUDIT_TEMPLATE,
-            SECURITY_FILE: SECURITY_TEMPLATE,
-            CODE_OF_CONDUCT_FILE: CODE_OF_CONDUCT_TEMPLATE,
+        files: dict[str, str | bytes] = {
+            CHANGELOG_FILE: CHANGELOG_TEMPLATE_BYTES,
+            CONTRIBUTING_FILE: CONTRIBUTING_TEMPLATE_BYTES,
+            AUDIT_FILE: AUDIT_TEMPLATE_BYTES,
+            SECURITY_FILE: SECURITY_TEMPLATE_BYTES,
+            CODE_OF_CONDUCT_FILE: CODE_OF_CONDUCT_TEMPLATE_BYTES,
             "docs/ARCHITECTURE.md": DOC_TEMPLATES.get("architecture.md", ""),
             "docs/DECISIONS.md": DOC_TEMPLATES.get("decisions.md", ""),
             "docs/TESTING.md": DOC_TEMPLATES.get("testing.md", ""),
         }
-        for filename, content in files.items():
-            AntigravityEngine.write_file(os.path.join(base_dir, filename), content, exist_ok=safe_mode)
+        AntigravityEngine.write_many(
+            ((os.path.join(base_dir, filename), content) for filename, content in files.items()), exist_ok=safe_mode
+        )
 
     @staticmethod
     def _handle_safe_mode(project_name: str, base_dir: str, safe_mode: bool | None) -> bool | None:
@@ -561,66 +640,56 @@ class AntigravityGenerator:
         global_agent_rules = Path.home() / ".antigravity" / "rules"
         if global_agent_rules.exists():
             logging.info("🌐 Inheriting Global Rules from ~/.antigravity")
-            for rule_file in global_agent_rules.glob("*.md"):
-                dest_path = os.path.join(base_dir, AGENT_DIR, "rules", f"global_{rule_file.name}")
-                with open(rule_file, encoding="utf-8") as rf:
-                    AntigravityEngine.write_file(dest_path, rf.read(), exist_ok=safe_mode)
+            rules_dir = os.path.join(base_dir, AGENT_DIR, "rules")
+            AntigravityEngine.write_many(
+                (
+                    (os.path.join(rules_dir, f"global_{rule_file.name}"), rule_file.read_text(encoding="utf-8"))
+                    for rule_file in global_agent_rules.glob("*.md")
+                ),
+                exist_ok=safe_mode,
+            )
 
     @staticmethod
     def _generate_core_config_files(base_dir: str, project_name: str, final_stack: list[str], safe_mode: bool) -> None:
         """Generates core configuration files like .gitignore, README, env, etc."""
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, GITIGNORE_FILE), AntigravityBuilder.build_gitignore(final_stack), exist_ok=True
-        )
-
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, README_FILE),
-            PROFESSIONAL_README_TEMPLATE.format(project_name=project_name, tech_stack=", ".join(final_stack)),
-            exist_ok=True,
-        )
-        AntigravityEngine.write_file(os.path.join(base_dir, ENV_EXAMPLE_FILE), "API_KEY=\nDB_URL=", exist_ok=safe_mode)
-        # Bridge and Architecture docs
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, AGENT_DIR, "skills", "bridge", "bridge.py"),
-            AGENT_SKILLS["bridge/bridge.py"],
-            exist_ok=safe_mode,
-        )
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, "docs", "ARCHITECTURE.md"),
-            MERMAID_PROJECT_MAP.format(project_name=project_name),
-            exist_ok=safe_mode,
-        )
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, "context", "links.md"),
-            AntigravityBuilder.build_links(project_name),
-            exist_ok=safe_mode,
-        )
-        # 4. Semantic RAG Index
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, "docs", "imported", "INDEX.md"),
-            AntigravityBuilder.build_docs_index(os.path.join(base_dir, "docs", "imported")),
+        # Always (re)generated, subject only to smart overwrite
+        AntigravityEngine.write_many(
+            [
+                (os.path.join(base_dir, GITIGNORE_FILE), AntigravityBuilder.build_gitignore_bytes(final_stack)),
+                (os.path.join(base_dir, README_FILE), _render_readme(project_name, ", ".join(final_stack))),
+                # 4. Semantic RAG Index
+                (
+                    os.path.join(base_dir, "docs", "imported", "INDEX.md"),
+                    AntigravityBuilder.build_docs_index(os.path.join(base_dir, "docs", "imported")),
+                ),
+            ],
             exist_ok=True,
         )
-        # Bootstrap Guide
-        AntigravityEngine.write_file(
-            os.path.join(base_dir, BOOTSTRAP_FILE),
-            """# Agent Start Guide
-
-1. **Protocol:** Review `.agent/manifest.json` for project structure.
-2. **Context:** Read `.agent/memory/scratchpad.md` and `.agent/memory/evolution.md`.
-3. **Safety:** Ensure `scripts/sentinel.py` is running for monitoring.
-4. **Action:** Use `/plan` to break down tasks or `/bootstrap` for code generation.
-5. **Standards:** Follow the v2.0.0 Agent Protocol in `.agent/rules/`.
-""",
+        # Respect safe mode
+        AntigravityEngine.write_many(
+            [
+                (os.path.join(base_dir, ENV_EXAMPLE_FILE), _ENV_EXAMPLE_BYTES),
+                # Bridge and Architecture docs
+                (os.path.join(base_dir, AGENT_DIR, "skills", "bridge", "bridge.py"), AGENT_SKILLS["bridge/bridge.py"]),
+                (
+                    os.path.join(base_dir, "docs", "ARCHITECTURE.md"),
+                    MERMAID_PROJECT_MAP.format(project_name=project_name),
+                ),
+                (os.path.join(base_dir, "context", "links.md"), AntigravityBuilder.build_links(project_name)),
+                # Bootstrap Guide
+                (os.path.join(base_dir, BOOTSTRAP_FILE), _BOOTSTRAP_GUIDE_BYTES),
+            ],
             exist_ok=safe_mode,
         )
 
     @staticmethod
-    def _generate_license(base_dir: str, license_type: str, safe_mode: bool) -> None:
+    def _generate_license(base_dir: str, license_type: str, safe_mode: bool, year: int | None = None) -> None:
         """Generates the LICENSE file."""
-        license_content = LICENSE_TEMPLATES.get(license_type, LICENSE_TEMPLATES["mit"])
         if license_type == "mit":
-            license_content = license_content.format(year=datetime.now().year, author="pkeffect")
+            license_content = _render_mit_license(year or datetime.now().year)
+        else:
+            # Static bodies are encoded once; unknown types fall back to the MIT text as before
+            license_content = LICENSE_TEMPLATES.prepared(license_type if license_type in LICENSE_TEMPLATES else "mit")
         AntigravityEngine.write_file(os.path.join(base_dir, LICENSE_FILE), license_content, exist_ok=safe_mode)
 
     @staticmethod
@@ -643,13 +712,15 @@ class AntigravityGenerator:
         if not blueprint_data:
             return
 
-        for rule in blueprint_data.get("rules", []):
-            if rule in AGENT_RULES:
-                AntigravityEngine.write_file(
-                    os.path.join(base_dir, AGENT_DIR, "rules", rule),
-                    AGENT_RULES[rule],
-                    exist_ok=False,
-                )
+        rules_dir = os.path.join(base_dir, AGENT_DIR, "rules")
+        AntigravityEngine.write_many(
+            [
+                (os.path.join(rules_dir, rule), AGENT_RULES[rule])
+                for rule in blueprint_data.get("rules", [])
+                if rule in AGENT_RULES
+            ],
+            exist_ok=False,
+        )
 
     @staticmethod
     def _generate_health_badge(base_dir: str, project_name: str) -> None:
@@ -701,6 +772,11 @@ class AntigravityGenerator:
         safe_mode = safe_mode_result
 
         logging.info(f"🚀 Constructing '{project_name}' (v{VERSION})...")
+        # One timestamp for the whole run (manifest, scratchpad, license year)
+        now = datetime.now()
+
+        # Each run starts with a fresh directory cache, so it holds only this project's folders
+        AntigravityEngine.reset_dir_cache()
 
         # Setup logging in target directory
         AntigravityEngine.setup_logging(base_dir)
@@ -714,16 +790,15 @@ class AntigravityGenerator:
 
         # Create directory structure
         directories = AntigravityGenerator._get_directory_structure(blueprint_data)
-        for d in directories:
-            AntigravityEngine.create_folder(os.path.join(base_dir, d))
+        AntigravityEngine.create_folders(os.path.join(base_dir, d) for d in directories)
 
         # Process brain dump
         detected_stack: list[str] = []
         if brain_dump_path:
             detected_stack = AntigravityAssimilator.process_brain_dump(brain_dump_path, base_dir)
 
-        # Merge keywords
-        final_stack = list(set(keywords + detected_stack))
+        # Merge keywords once, deduplicated in first-seen order so generated files are stable across runs
+        final_stack = list(dict.fromkeys(keywords + detected_stack))
         if not final_stack:
             final_stack = ["linux"]
         logging.info(f"⚙️  Final Tech Stack: {', '.join(final_stack)}")
@@ -735,7 +810,7 @@ class AntigravityGenerator:
         AntigravityGenerator._generate_core_config_files(base_dir, project_name, final_stack, safe_mode)
 
         # Generate License
-        AntigravityGenerator._generate_license(base_dir, license_type, safe_mode)
+        AntigravityGenerator._generate_license(base_dir, license_type, safe_mode, now.year)
 
         # Community Standards
         AntigravityGenerator.generate_community_standards(base_dir, safe_mode=safe_mode)
@@ -746,7 +821,9 @@ class AntigravityGenerator:
         # Phase 15: API Documentation for web stacks
         web_keywords = ["fastapi", "nextjs", "react", "node", "go-fiber"]
         if any(kw in final_stack for kw in web_keywords):
-            api_doc = DOC_TEMPLATES.get("api.md", "").format(project_name=project_name, stack=", ".join(final_stack))
+            api_doc = _compile_template(DOC_TEMPLATES.get("api.md", "")).render(
+                project_name=project_name, stack=", ".join(final_stack)
+            )
             AntigravityEngine.write_file(os.path.join(base_dir, "docs", "API.md"), api_doc, exist_ok=safe_mode)
 
         # Agent files
@@ -757,6 +834,7 @@ class AntigravityGenerator:
             safe_mode=safe_mode,
             custom_templates=custom_templates,
             personality=personality,
+            now=now,
         )
 
         # Phase 17: Health Badge
@@ -780,6 +858,7 @@ class AntigravityGenerator:
 
         # Time-Travel: Git Initialization hook
         AntigravityGenerator._setup_git_hooks(base_dir)
+        logging.info(f"🗂️  Per-file activity logged to {os.path.join(base_dir, 'antigravity_setup.log')}")
 
         print(f"\n✅ Project '{project_name}' ready (v{VERSION})!")
         print(f"📂 Location: {os.path.abspath(base_dir)}\n")
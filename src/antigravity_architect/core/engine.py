@@ -1,18 +1,79 @@
+import atexit
+import contextlib
 import difflib
+import functools
 import hashlib
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import Any
 
 from antigravity_architect.resources.constants import PRESETS_DIR
 
+# --- Precompiled Patterns ---
+_WS_RE = re.compile(r"\s+")
+_NAME_SAFE_RE = re.compile(r"[^a-zA-Z0-9_\-]")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_BATCH_RE = re.compile(r"[^a-z0-9\n]+")
+_COMMA_TABLE = str.maketrans(",", " ")
+
+# Per-file activity goes through the package logger, which setup_logging opens to DEBUG
+_LOGGER = logging.getLogger(__name__)
+
+
+def _universal_newlines(text: str) -> str:
+    """Translates CRLF and lone CR to LF, as text-mode reads do."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+@functools.lru_cache(maxsize=1024)
+def _clean_name(name: str) -> str:
+    """Regex half of sanitize_name, memoized since the same names recur during a run."""
+    return _NAME_SAFE_RE.sub("", _WS_RE.sub("_", name.strip()))
+
+
+@functools.lru_cache(maxsize=1024)
+def _slugify(title: str) -> str:
+    """Memoized body of slugify_title."""
+    # Single pass: runs of non-alphanumerics (header markers included) become one underscore
+    slug = _SLUG_RE.sub("_", title.lower())
+    # Strip leading/trailing underscores
+    slug = slug.strip("_")
+    # Ensure non-empty and reasonable length
+    if not slug:
+        slug = "untitled"
+    return slug[:50]
+
+
+# Directories already created by this process; lets repeated writes skip makedirs.
+_MKDIR_CACHE: set[str] = set()
+
+
+# Background listener that owns the log file handler (see setup_logging).
+_LOG_LISTENER: logging.handlers.QueueListener | None = None
+
+
+def _stop_log_listener() -> None:
+    """Drains and closes the background log file handler, if one is running."""
+    global _LOG_LISTENER
+    if _LOG_LISTENER is not None:
+        _LOG_LISTENER.stop()
+        for handler in _LOG_LISTENER.handlers:
+            handler.close()
+        _LOG_LISTENER = None
+
+
+atexit.register(_stop_log_listener)
+
 
 class AntigravityEngine:
     """
@@ -23,25 +84,47 @@ class AntigravityEngine:
     All methods are static as they don't require instance state.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def setup_logging(log_dir: str | None = None) -> None:
-        """Configure logging to both file and stdout."""
+        """
+        Configure logging to both file and stdout.
+
+        Console output stays synchronous so it interleaves with prints; file writes
+        are queued to a background QueueListener, off the generation path.
+        Per-file activity is logged at DEBUG on the package logger only, so it reaches
+        the log file while the console and the root logger stay at INFO.
+        """
+        global _LOG_LISTENER
         if log_dir:
             os.makedirs(log_dir, exist_ok=True)
             log_path = os.path.join(log_dir, "antigravity_setup.log")
         else:
             log_path = os.path.join(tempfile.gettempdir(), "antigravity_setup.log")
 
-        # Use force=True to allow re-configuring logging (Python 3.8+)
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(levelname)s] %(message)s",
-            handlers=[
-                logging.FileHandler(log_path, mode="w", encoding="utf-8"),
-                logging.StreamHandler(sys.stdout),
-            ],
-            force=True,
-        )
+        # Replace any previous configuration, as basicConfig(force=True) did
+        _stop_log_listener()
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+            handler.close()
+
+        formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+        file_handler = logging.FileHandler(log_path, mode="w", encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setFormatter(formatter)
+        console_handler.setLevel(logging.INFO)
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _LOG_LISTENER = logging.handlers.QueueListener(log_queue, file_handler)
+        _LOG_LISTENER.start()
+
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+        root.addHandler(console_handler)
+        root.setLevel(logging.INFO)
+        logging.getLogger("antigravity_architect").setLevel(logging.DEBUG)
 
     @staticmethod
     def sanitize_name(name: str | None) -> str:
@@ -53,8 +136,7 @@ class AntigravityEngine:
         if not name:
             return "antigravity-project"
 
-        clean = re.sub(r"\s+", "_", name.strip())
-        clean = re.sub(r"[^a-zA-Z0-9_\-]", "", clean)
+        clean = _clean_name(name)
 
         # Security: Prevent path traversal attempts
         if ".." in clean or clean.startswith(("/", "\\")):
@@ -75,26 +157,31 @@ class AntigravityEngine:
         Handles special characters, unicode, and edge cases for cross-platform safety.
         Used primarily by the Assimilator for Brain Dump section titles.
         """
-        # Remove markdown header markers
-        slug = re.sub(r"^#+\s*", "", title)
-        # Convert to lowercase and replace spaces/special chars with underscores
-        slug = re.sub(r"[^a-zA-Z0-9]", "_", slug.lower())
-        # Collapse multiple underscores
-        slug = re.sub(r"_+", "_", slug)
-        # Strip leading/trailing underscores
-        slug = slug.strip("_")
-        # Ensure non-empty and reasonable length
-        if not slug:
-            slug = "untitled"
-        return slug[:50]
+        return _slugify(title)
+
+    @staticmethod
+    def slugify_titles(titles: list[str]) -> list[str]:
+        """
+        Batch form of slugify_title for many headers at once.
+
+        Joins the titles with newlines and runs a single lowercase + regex pass over
+        the whole block, then splits it back. Titles that themselves contain newlines
+        fall back to per-title slugging.
+        """
+        if not titles:
+            return []
+        if any("\n" in t for t in titles):
+            return [_slugify(t) for t in titles]
+        block = _SLUG_BATCH_RE.sub("_", "\n".join(titles).lower())
+        return [slug.strip("_")[:50] or "untitled" for slug in block.split("\n")]
 
     @staticmethod
     def parse_keywords(input_str: str | None) -> list[str]:
         """Converts comma/space separated string to list of lowercase keywords."""
         if not input_str:
             return []
-        raw = re.split(r"[,\s]+", input_str)
-        return [w.lower().strip() for w in raw if w.strip()]
+        # str.split() collapses whitespace runs and drops empty tokens on its own
+        return input_str.translate(_COMMA_TABLE).lower().split()
 
     @staticmethod
     def validate_file_path(filepath: str | None) -> bool:
@@ -130,20 +217,27 @@ class AntigravityEngine:
         )
 
     @staticmethod
-    def _get_checksum(content: str) -> str:
-        """Returns SHA-256 checksum of normalized content."""
+    def _normalize_content(content: str | bytes) -> str:
+        """Returns content as compared by checksums: decoded, stripped, LF line endings."""
+        if isinstance(content, bytes):
+            content = content.decode("utf-8", errors="replace")
         # Normalize line endings to avoid OS-specific checksum drift
-        normalized = content.strip().replace("\r\n", "\n")
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        return content.strip().replace("\r\n", "\n")
+
+    @staticmethod
+    def _get_checksum(content: str | bytes) -> str:
+        """Returns SHA-256 checksum of normalized content."""
+        return hashlib.sha256(AntigravityEngine._normalize_content(content).encode("utf-8")).hexdigest()
 
     @staticmethod
-    def write_file(path: str, content: str, exist_ok: bool = False, smart_overwrite: bool = True) -> bool:
+    def write_file(path: str, content: str | bytes, exist_ok: bool = False, smart_overwrite: bool = True) -> bool:
         """
         Writes a new file, creating parent directories as needed.
 
         Args:
             path: Destination path
-            content: File content
+            content: File content. ``bytes`` are treated as already prepared
+                (stripped, newline-terminated, UTF-8) and written verbatim.
             exist_ok: If True, skip if file exists (Legacy Safe Mode).
             smart_overwrite: If True, only overwrite if content hash differs.
 
@@ -151,28 +245,105 @@ class AntigravityEngine:
         """
         try:
             if exist_ok and os.path.exists(path):
-                logging.info(f"⏭️  Skipped (Exists): {path}")
+                _LOGGER.debug(f"⏭️  Skipped (Exists): {path}")
                 return True
 
-            if smart_overwrite and os.path.exists(path):
-                with open(path, encoding="utf-8") as f:
-                    existing = f.read()
-
-                if AntigravityEngine._get_checksum(existing) == AntigravityEngine._get_checksum(content):
-                    logging.info(f"✨ Unchanged: {path}")
-                    return True
-
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(content.strip() + "\n")
-
-            icon = "✅" if not os.path.exists(path) else "📝"
-            logging.info(f"{icon} Wrote: {path}")
+            if smart_overwrite:
+                # Opening directly doubles as the existence check (no separate stat)
+                try:
+                    with open(path, "rb") as f:
+                        existing = f.read()
+                except FileNotFoundError:
+                    pass
+                else:
+                    # Files this tool wrote match prepared bytes exactly; otherwise compare the
+                    # normalized text directly (equal text <=> equal checksum, without hashing)
+                    if existing == content or AntigravityEngine._normalize_content(
+                        _universal_newlines(existing.decode("utf-8"))
+                    ) == AntigravityEngine._normalize_content(content):
+                        _LOGGER.debug(f"✨ Unchanged: {path}")
+                        return True
+
+            # Encode once and hand the payload to a single unbuffered write
+            data = content if isinstance(content, bytes) else (content.strip() + "\n").encode("utf-8")
+            AntigravityEngine._in_dir(os.path.dirname(path), lambda: AntigravityEngine._write_bytes(path, data))
+
+            _LOGGER.debug(f"📝 Wrote: {path}")
             return True
         except OSError as e:
             logging.error(f"❌ Error writing {path}: {e}")
             return False
 
+    @staticmethod
+    def write_many(entries: Iterable[tuple[str, str | bytes]], exist_ok: bool = False) -> list[bool]:
+        """
+        Writes a batch of independent files concurrently.
+
+        Every parent directory is created up front on the calling thread, so the
+        worker threads only open and write. Returns one ``write_file`` result per
+        entry, in input order.
+        """
+        batch = list(entries)
+        for parent in sorted({os.path.dirname(path) for path, _ in batch}):
+            # On failure, write_file retries and reports the error per entry
+            with contextlib.suppress(OSError):
+                AntigravityEngine._ensure_dir(parent)
+
+        if len(batch) < 2:
+            return [AntigravityEngine.write_file(path, content, exist_ok=exist_ok) for path, content in batch]
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            return list(
+                executor.map(lambda item: AntigravityEngine.write_file(item[0], item[1], exist_ok=exist_ok), batch)
+            )
+
+    @staticmethod
+    def reset_dir_cache() -> None:
+        """Forgets which directories this process has created (called per generation run)."""
+        _MKDIR_CACHE.clear()
+
+    @staticmethod
+    def _ensure_dir(directory: str) -> None:
+        """Creates ``directory`` once per process; later calls are a set lookup."""
+        if directory and directory not in _MKDIR_CACHE:
+            os.makedirs(directory, exist_ok=True)
+            _MKDIR_CACHE.add(directory)
+
+    @staticmethod
+    def _in_dir(directory: str, action: Callable[[], None]) -> None:
+        """
+        Runs ``action`` after ensuring ``directory`` exists.
+
+        If the directory was removed after being cached, it is recreated and
+        ``action`` is retried once.
+        """
+        AntigravityEngine._ensure_dir(directory)
+        try:
+            action()
+        except FileNotFoundError:
+            _MKDIR_CACHE.discard(directory)
+            AntigravityEngine._ensure_dir(directory)
+            action()
+
+    @staticmethod
+    def _write_bytes(path: str, data: bytes, append: bool = False) -> None:
+        """Writes ``data`` through a raw file descriptor, bypassing the buffered IO layers."""
+        mode = os.O_APPEND if append else os.O_TRUNC
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Creates ``path`` if missing without writing anything to it."""
+        os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o666))
+
     @staticmethod
     def append_file(path: str, content: str) -> bool:
         """
@@ -181,10 +352,12 @@ class AntigravityEngine:
         Returns True on success, False on failure.
         """
         try:
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "a", encoding="utf-8") as f:
-                f.write("\n\n" + content.strip() + "\n")
-            logging.info(f"🔗 Appended to: {path}")
+            # Encoded up front so the append is a single unbuffered write, like write_file
+            data = ("\n\n" + content.strip() + "\n").encode("utf-8")
+            AntigravityEngine._in_dir(
+                os.path.dirname(path), lambda: AntigravityEngine._write_bytes(path, data, append=True)
+            )
+            _LOGGER.debug(f"🔗 Appended to: {path}")
             return True
         except OSError as e:
             logging.error(f"❌ Error appending {path}: {e}")
@@ -233,16 +406,51 @@ class AntigravityEngine:
         Returns True on success, False on failure.
         """
         try:
-            os.makedirs(path, exist_ok=True)
             gitkeep_path = os.path.join(path, ".gitkeep")
-            with open(gitkeep_path, "w") as f:
-                f.write("")
-            logging.info(f"📁 Directory: {path}")
+            AntigravityEngine._in_dir(path, lambda: AntigravityEngine._touch(gitkeep_path))
+            _LOGGER.debug(f"📁 Directory: {path}")
             return True
         except OSError as e:
             logging.error(f"❌ Error creating folder {path}: {e}")
             return False
 
+    @staticmethod
+    def create_folders(paths: Iterable[str]) -> bool:
+        """
+        Creates several folders, each with a .gitkeep, in a single pass.
+
+        Only the leaf folders are passed to makedirs (deepest first); every listed
+        ancestor is created along the way and marked in the directory cache, so its
+        .gitkeep is a plain touch. Returns True only if every folder succeeded.
+        """
+        unique = set(paths)
+        ancestors: set[str] = set()
+        for path in unique:
+            parent = os.path.dirname(path)
+            while parent and parent not in ancestors and parent != os.path.dirname(parent):
+                ancestors.add(parent)
+                parent = os.path.dirname(parent)
+
+        for leaf in sorted(unique - ancestors, key=lambda p: p.count(os.sep), reverse=True):
+            with contextlib.suppress(OSError):  # Reported per folder below
+                AntigravityEngine._ensure_dir(leaf)
+                parent = os.path.dirname(leaf)
+                while parent in ancestors and parent not in _MKDIR_CACHE:
+                    _MKDIR_CACHE.add(parent)
+                    parent = os.path.dirname(parent)
+
+        ok = True
+        for path in sorted(unique):
+            try:
+                AntigravityEngine._in_dir(
+                    path, functools.partial(AntigravityEngine._touch, os.path.join(path, ".gitkeep"))
+                )
+                _LOGGER.debug(f"📁 Directory: {path}")
+            except OSError as e:
+                logging.error(f"❌ Error creating folder {path}: {e}")
+                ok = False
+        return ok
+
     @staticmethod
     def save_preset(name: str, args: dict) -> bool:
         """Saves current CLI arguments as a named preset."""
@@ -5,6 +5,8 @@ import os
 class AntigravityGovernance:
     """Phase 16: Security & Governance - Handles licenses and safety checks."""
 
+    __slots__ = ()
+
     @staticmethod
     def scan_licenses(base_dir: str) -> dict[str, str]:
         """Scans for dependency licenses and identifies potential conflicts."""
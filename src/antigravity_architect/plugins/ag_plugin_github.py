@@ -5,11 +5,13 @@ Provides templates and configuration for GitHub Actions, Issue Templates, PR Tem
 Funding configurations, and Copilot Instructions.
 """
 
+import functools
 import logging
 from pathlib import Path
 from typing import Any
 
 from antigravity_architect.core.engine import AntigravityEngine
+from antigravity_architect.resources.templates import CompiledTemplate, prepare_template
 
 PLUGIN_DESCRIPTION = "GitHub Templates and Actions integration"
 
@@ -201,6 +203,23 @@ This project uses **{tech_stack}** as its core technology stack. All code should
 _Generated by Antigravity Architect_
 """
 
+_COPILOT_INSTRUCTIONS_COMPILED = CompiledTemplate(GITHUB_COPILOT_INSTRUCTIONS)
+
+# Static templates, prepared once for verbatim writes
+_BUG_REPORT_BYTES = prepare_template(GITHUB_BUG_REPORT)
+_FEATURE_REQUEST_BYTES = prepare_template(GITHUB_FEATURE_REQUEST)
+_QUESTION_BYTES = prepare_template(GITHUB_QUESTION)
+_ISSUE_CONFIG_BYTES = prepare_template(GITHUB_ISSUE_CONFIG)
+_PR_TEMPLATE_BYTES = prepare_template(GITHUB_PR_TEMPLATE)
+_FUNDING_BYTES = prepare_template(GITHUB_FUNDING)
+_CI_TEMPLATE_BYTES = prepare_template(GITHUB_CI_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_copilot_instructions(tech_stack: str) -> bytes:
+    """Renders and prepares the Copilot instructions once per distinct stack string."""
+    return prepare_template(_COPILOT_INSTRUCTIONS_COMPILED.render(tech_stack=tech_stack))
+
 
 def on_generation_complete(
     project_name: str,
@@ -217,18 +236,17 @@ def on_generation_complete(
     issue_template_dir = github_dir / "ISSUE_TEMPLATE"
 
     # Create directories
-    AntigravityEngine.create_folder(str(workflow_dir))
-    AntigravityEngine.create_folder(str(issue_template_dir))
-
-    templates = {
-        issue_template_dir / "bug_report.md": GITHUB_BUG_REPORT,
-        issue_template_dir / "feature_request.md": GITHUB_FEATURE_REQUEST,
-        issue_template_dir / "question.md": GITHUB_QUESTION,
-        issue_template_dir / "config.yml": GITHUB_ISSUE_CONFIG,
-        github_dir / "PULL_REQUEST_TEMPLATE.md": GITHUB_PR_TEMPLATE,
-        github_dir / "FUNDING.yml": GITHUB_FUNDING,
-        github_dir / "copilot-instructions.md": GITHUB_COPILOT_INSTRUCTIONS.format(tech_stack=", ".join(final_stack)),
-        workflow_dir / "ci.yml": GITHUB_CI_TEMPLATE,
+    AntigravityEngine.create_folders([str(workflow_dir), str(issue_template_dir)])
+
+    templates: dict[Path, str | bytes] = {
+        issue_template_dir / "bug_report.md": _BUG_REPORT_BYTES,
+        issue_template_dir / "feature_request.md": _FEATURE_REQUEST_BYTES,
+        issue_template_dir / "question.md": _QUESTION_BYTES,
+        issue_template_dir / "config.yml": _ISSUE_CONFIG_BYTES,
+        github_dir / "PULL_REQUEST_TEMPLATE.md": _PR_TEMPLATE_BYTES,
+        github_dir / "FUNDING.yml": _FUNDING_BYTES,
+        github_dir / "copilot-instructions.md": _render_copilot_instructions(", ".join(final_stack)),
+        workflow_dir / "ci.yml": _CI_TEMPLATE_BYTES,
     }
 
     for path, content in templates.items():
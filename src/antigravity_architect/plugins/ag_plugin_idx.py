@@ -2,6 +2,7 @@
 Google Project IDX Integration Plugin for Antigravity Architect
 """
 
+import functools
 import logging
 import os
 from typing import Any
@@ -10,54 +11,63 @@ from antigravity_architect.core.engine import AntigravityEngine
 
 PLUGIN_DESCRIPTION = "Google Project IDX Integration (dev.nix)"
 
-NIX_PACKAGE_MAP = {
-    "python": ["pkgs.python312", "pkgs.python312Packages.pip", "pkgs.ruff", "pkgs.python312Packages.virtualenv"],
-    "node": ["pkgs.nodejs_20", "pkgs.nodePackages.nodemon", "pkgs.nodePackages.typescript"],
-    "docker": ["pkgs.docker", "pkgs.docker-compose"],
-    "sql": ["pkgs.sqlite", "pkgs.postgresql"],
+NIX_PACKAGE_MAP: dict[str, tuple[str, ...]] = {
+    "python": ("pkgs.python312", "pkgs.python312Packages.pip", "pkgs.ruff", "pkgs.python312Packages.virtualenv"),
+    "node": ("pkgs.nodejs_20", "pkgs.nodePackages.nodemon", "pkgs.nodePackages.typescript"),
+    "docker": ("pkgs.docker", "pkgs.docker-compose"),
+    "sql": ("pkgs.sqlite", "pkgs.postgresql"),
 }
 
+# Map framework keywords to their base language
+_NIX_KEYWORD_ALIASES: dict[str, str] = {
+    "js": "node",
+    "javascript": "node",
+    "react": "node",
+    "nextjs": "node",
+    "django": "python",
+    "flask": "python",
+    "fastapi": "python",
+}
 
-def build_nix_config(keywords: list[str]) -> str:
-    """Builds a dev.nix configuration for Google Project IDX."""
-    packages = ["pkgs.git", "pkgs.curl", "pkgs.jq", "pkgs.openssl"]
-
-    # Map framework keywords to their base language
-    keyword_aliases: dict[str, str] = {
-        "js": "node",
-        "javascript": "node",
-        "react": "node",
-        "nextjs": "node",
-        "django": "python",
-        "flask": "python",
-        "fastapi": "python",
-    }
-
-    for k in keywords:
-        key = keyword_aliases.get(k, k)
-        if key in NIX_PACKAGE_MAP:
-            packages.extend(NIX_PACKAGE_MAP[key])
-
-    package_str = "\n    ".join(sorted(set(packages)))
-    return f"""# Google Project IDX Environment Configuration
-{{ pkgs, ... }}: {{
+# Static parts of dev.nix around the package list
+_NIX_HEADER = """# Google Project IDX Environment Configuration
+{ pkgs, ... }: {
   channel = "stable-23.11";
   packages = [
-    {package_str}
+    """
+_NIX_FOOTER = """
   ];
-  env = {{}};
-  idx = {{
+  env = {};
+  idx = {
     extensions = ["google.gemini-code-assist"];
-    workspace = {{
-      onCreate = {{
+    workspace = {
+      onCreate = {
         setup = "echo 'Antigravity Environment Ready'";
-      }};
-    }};
-  }};
-}}
+      };
+    };
+  };
+}
 """
 
 
+def build_nix_config(keywords: list[str]) -> str:
+    """Builds a dev.nix configuration for Google Project IDX."""
+    return _render_nix_config(frozenset(keywords))
+
+
+@functools.lru_cache(maxsize=128)
+def _render_nix_config(keywords: frozenset[str]) -> str:
+    """Renders dev.nix once per distinct keyword set (package output is sorted, so order is irrelevant)."""
+    packages = {"pkgs.git", "pkgs.curl", "pkgs.jq", "pkgs.openssl"}
+
+    for k in keywords:
+        key = _NIX_KEYWORD_ALIASES.get(k, k)
+        if key in NIX_PACKAGE_MAP:
+            packages.update(NIX_PACKAGE_MAP[key])
+
+    return _NIX_HEADER + "\n    ".join(sorted(packages)) + _NIX_FOOTER
+
+
 def on_generation_complete(**kwargs: Any) -> None:
     """Triggered after core project generation is complete."""
     base_dir = kwargs.get("base_dir")
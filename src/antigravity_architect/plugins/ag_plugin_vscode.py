@@ -3,9 +3,13 @@ Antigravity Architect - VS Code Sidecar Plugin
 Provides configuration generation for Visual Studio Code (.vscode and .devcontainer).
 """
 
+import functools
 import os
 from typing import Any
 
+from antigravity_architect.core.engine import AntigravityEngine
+from antigravity_architect.resources.templates import CompiledTemplate
+
 PLUGIN_DESCRIPTION = "Provides Visual Studio Code and DevContainer configurations."
 
 # Constants moved from AntigravityResources
@@ -23,20 +27,20 @@ DEVCONTAINER_JSON = """{
 }
 """
 
-VSCODE_EXTENSIONS_MAP: dict[str, list[str]] = {
-    "python": ["ms-python.python", "ms-python.vscode-pylance", "charliermarsh.ruff"],
-    "node": [EXT_ESLINT, EXT_PRETTIER],
-    "javascript": [EXT_ESLINT, EXT_PRETTIER],
-    "typescript": [EXT_ESLINT, EXT_PRETTIER],
-    "docker": ["ms-azuretools.vscode-docker"],
-    "react": ["dsznajder.es7-react-js-snippets"],
-    "general": [
+VSCODE_EXTENSIONS_MAP: dict[str, tuple[str, ...]] = {
+    "python": ("ms-python.python", "ms-python.vscode-pylance", "charliermarsh.ruff"),
+    "node": (EXT_ESLINT, EXT_PRETTIER),
+    "javascript": (EXT_ESLINT, EXT_PRETTIER),
+    "typescript": (EXT_ESLINT, EXT_PRETTIER),
+    "docker": ("ms-azuretools.vscode-docker",),
+    "react": ("dsznajder.es7-react-js-snippets",),
+    "general": (
         "donjayamanne.githistory",
         "eamodio.gitlens",
         "usernamehw.errorlens",
         "pkief.material-icon-theme",
         "christian-kohler.path-intellisense",
-    ],
+    ),
 }
 
 VSCODE_SETTINGS_TEMPLATE = """{{
@@ -114,38 +118,54 @@ VSCODE_TASKS_TEMPLATE = """{{
 }}"""
 
 
+_VSCODE_SETTINGS_COMPILED = CompiledTemplate(VSCODE_SETTINGS_TEMPLATE)
+_VSCODE_LAUNCH_COMPILED = CompiledTemplate(VSCODE_LAUNCH_TEMPLATE)
+_VSCODE_TASKS_COMPILED = CompiledTemplate(VSCODE_TASKS_TEMPLATE)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_extensions_json(extensions: tuple[str, ...]) -> str:
+    """Renders extensions.json once per distinct (sorted, deduplicated) extension set."""
+    ext_str = ",\n        ".join(f'"{ext}"' for ext in extensions)
+    return f"""{{
+    "recommendations": [
+        {ext_str}
+    ]
+}}"""
+
+
 def build_vscode_config(keywords: list[str]) -> dict[str, str]:
     """Builds all .vscode/ configuration files."""
+    # Copy so callers can't mutate the cached mapping
+    return dict(_build_vscode_files(frozenset(keywords)))
+
+
+@functools.lru_cache(maxsize=128)
+def _build_vscode_files(keywords: frozenset[str]) -> dict[str, str]:
+    """Builds the .vscode/ files once per distinct keyword set; only membership affects the output."""
     files: dict[str, str] = {}
 
     # 1. extensions.json
-    extensions: list[str] = []
-
-    extensions.extend(VSCODE_EXTENSIONS_MAP["general"])
+    extensions = set(VSCODE_EXTENSIONS_MAP["general"])
     for k in keywords:
         key = k.lower()
         if key in VSCODE_EXTENSIONS_MAP:
-            extensions.extend(VSCODE_EXTENSIONS_MAP[key])
+            extensions.update(VSCODE_EXTENSIONS_MAP[key])
 
-    ext_str = ",\n        ".join(f'"{ext}"' for ext in sorted(set(extensions)))
-    files["extensions.json"] = f"""{{
-    "recommendations": [
-        {ext_str}
-    ]
-}}"""
+    files["extensions.json"] = _render_extensions_json(tuple(sorted(extensions)))
 
     # 2. settings.json (Dynamic default formatter)
     default_formatter = "esbenp.prettier-vscode"
     if "python" in keywords and "node" not in keywords and "javascript" not in keywords:
         default_formatter = "charliermarsh.ruff"
 
-    files["settings.json"] = VSCODE_SETTINGS_TEMPLATE.format(default_formatter=default_formatter)
+    files["settings.json"] = _VSCODE_SETTINGS_COMPILED.render(default_formatter=default_formatter)
 
     # 3. launch.json
-    files["launch.json"] = VSCODE_LAUNCH_TEMPLATE.format(configurations="")
+    files["launch.json"] = _VSCODE_LAUNCH_COMPILED.render(configurations="")
 
     # 4. tasks.json
-    files["tasks.json"] = VSCODE_TASKS_TEMPLATE.format(tasks="")
+    files["tasks.json"] = _VSCODE_TASKS_COMPILED.render(tasks="")
 
     # 5. antigravity.code-snippets
     files["antigravity.code-snippets"] = VSCODE_SNIPPETS_TEMPLATE
@@ -164,30 +184,11 @@ def on_generation_complete(**kwargs: Any) -> None:
     if not base_dir:
         return
 
-    # Create VSCode Dir
+    # Content is written verbatim (no strip/newline normalisation), one write per file
     vscode_path = os.path.join(base_dir, VSCODE_DIR)
-    os.makedirs(vscode_path, exist_ok=True)
-
-    # 1. Generate VSCode Config Files
-    vscode_files = build_vscode_config(final_stack)
-    for filename, content in vscode_files.items():
-        filepath = os.path.join(vscode_path, filename)
-        if safe_mode and os.path.exists(filepath):
-            continue
-        try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-        except OSError:
-            pass
-
-    # 2. Generate Devcontainer File
-    devcontainer_path = os.path.join(base_dir, DEVCONTAINER_DIR)
-    os.makedirs(devcontainer_path, exist_ok=True)
-    devcontainer_file_path = os.path.join(devcontainer_path, DEVCONTAINER_FILE)
-
-    if not (safe_mode and os.path.exists(devcontainer_file_path)):
-        try:
-            with open(devcontainer_file_path, "w", encoding="utf-8") as f:
-                f.write(DEVCONTAINER_JSON)
-        except OSError:
-            pass
+    entries = [
+        (os.path.join(vscode_path, filename), content.encode("utf-8"))
+        for filename, content in build_vscode_config(final_stack).items()
+    ]
+    entries.append((os.path.join(base_dir, DEVCONTAINER_DIR, DEVCONTAINER_FILE), DEVCONTAINER_JSON.encode("utf-8")))
+    AntigravityEngine.write_many(entries, exist_ok=safe_mode)
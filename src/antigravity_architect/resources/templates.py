@@ -1,6 +1,10 @@
 import json
 import os
+import string
+import sys
+from collections.abc import Iterator, Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 # Unused constants are available via .constants if needed,
@@ -15,6 +19,7 @@ class LazyTemplateDict(dict):
     def __init__(self, category: str) -> None:
         self.category = category
         self._data: dict | None = None
+        self._prepared: dict[str, bytes] = {}
 
     def _load(self) -> None:
         if self._data is None:
@@ -25,7 +30,9 @@ class LazyTemplateDict(dict):
 
             # Special handling for skills which can have subdirectories
             if self.category == "skills":
-                for root, _, files in os.walk(cat_path):
+                for root, dirs, files in os.walk(cat_path):
+                    # Skip bytecode caches created next to bundled skill scripts
+                    dirs[:] = [d for d in dirs if d != "__pycache__"]
                     for file in files:
                         full_path = Path(root) / file
                         rel_path = full_path.relative_to(cat_path)
@@ -73,12 +80,63 @@ class LazyTemplateDict(dict):
         self._load()
         return key in self._data
 
+    def prepared(self, key: str) -> bytes:
+        """Returns the template as write-ready bytes, encoded once per process."""
+        if key not in self._prepared:
+            self._prepared[key] = prepare_template(self[key])
+        return self._prepared[key]
+
+
+class CompiledTemplate:
+    """
+    A ``str.format``-style template parsed once into literal segments and field names.
+
+    Rendering joins the precomputed segments with the supplied values instead of
+    re-parsing the format string on every call. Only plain ``{name}`` fields are
+    supported; ``{{`` / ``}}`` escapes are resolved at compile time.
+    """
+
+    __slots__ = ("_head", "_tail", "fields", "source")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        literals: list[str] = []
+        fields: list[str] = []
+        pending = ""
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            pending += literal
+            if field is None:
+                continue
+            if spec or conversion:
+                raise ValueError(f"Unsupported format spec in template field: {field}")
+            literals.append(pending)
+            fields.append(field)
+            pending = ""
+        literals.append(pending)
+
+        self.fields: tuple[str, ...] = tuple(fields)
+        self._head = literals[0]
+        self._tail: tuple[tuple[str, str], ...] = tuple(zip(fields, literals[1:], strict=True))
+
+    def render(self, **values: Any) -> str:
+        """Substitutes ``values`` into the template (raises KeyError on missing fields)."""
+        parts = [self._head]
+        for field, literal in self._tail:
+            parts.append(str(values[field]))
+            parts.append(literal)
+        return "".join(parts)
+
 
 def load_common(name: str) -> str:
     path = TEMPLATE_BASE / "common" / name
     return path.read_text(encoding="utf-8") if path.exists() else ""
 
 
+def prepare_template(content: str) -> bytes:
+    """Normalizes a static template the way write_file would and encodes it once."""
+    return (content.strip() + "\n").encode("utf-8")
+
+
 # --- Mapping Dicts (Lazy) ---
 AGENT_RULES = LazyTemplateDict("rules")
 AGENT_WORKFLOWS = LazyTemplateDict("workflows")
@@ -101,6 +159,20 @@ LINKS_TEMPLATE = load_common("links.md")
 GRAVEYARD_TEMPLATE = load_common("graveyard.md")
 EVOLUTION_TEMPLATE = load_common("evolution.md")
 
+# --- Compiled Templates (parsed once, rendered by segment join) ---
+PROFESSIONAL_README_COMPILED = CompiledTemplate(PROFESSIONAL_README_TEMPLATE)
+LINKS_COMPILED = CompiledTemplate(LINKS_TEMPLATE)
+
+# --- Prepared Bytes (written verbatim, no per-write strip/encode) ---
+CHANGELOG_TEMPLATE_BYTES = prepare_template(CHANGELOG_TEMPLATE)
+CONTRIBUTING_TEMPLATE_BYTES = prepare_template(CONTRIBUTING_TEMPLATE)
+AUDIT_TEMPLATE_BYTES = prepare_template(AUDIT_TEMPLATE)
+SECURITY_TEMPLATE_BYTES = prepare_template(SECURITY_TEMPLATE)
+CODE_OF_CONDUCT_TEMPLATE_BYTES = prepare_template(CODE_OF_CONDUCT_TEMPLATE)
+GRAVEYARD_TEMPLATE_BYTES = prepare_template(GRAVEYARD_TEMPLATE)
+EVOLUTION_TEMPLATE_BYTES = prepare_template(EVOLUTION_TEMPLATE)
+SENTINEL_PY_BYTES = prepare_template(SENTINEL_PY)
+
 # Static legacy placeholders required for backward compatibility
 AGENT_MANIFEST_TEMPLATE = ""
 
@@ -115,6 +187,44 @@ def _load_json_resource(category: str, name: str) -> dict:
     return {}
 
 
-GITIGNORE_MAP = _load_json_resource("common", "gitignore_map.json")
-LICENSE_TEMPLATES = _load_json_resource("common", "licenses.json")
+class LazyJsonResource(Mapping[str, Any]):
+    """
+    Lazily parses a single JSON resource file on first access.
+
+    A read-only ``Mapping`` rather than a ``dict`` subclass, so equality and
+    ``dict(...)`` conversions see the parsed entries instead of empty dict storage.
+    """
+
+    def __init__(self, category: str, name: str) -> None:
+        self.category = category
+        self.name = name
+        self._data: dict[str, Any] | None = None
+        self._prepared: dict[str, bytes] = {}
+
+    def _load(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = _load_json_resource(self.category, self.name)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def prepared(self, key: str) -> bytes:
+        """Returns the entry as write-ready bytes, encoded once per process."""
+        if key not in self._prepared:
+            self._prepared[key] = prepare_template(self[key])
+        return self._prepared[key]
+
+
+# Read-only view with interned blocks; entries are stored expanded in the JSON file.
+GITIGNORE_MAP: MappingProxyType[str, str] = MappingProxyType(
+    {k: sys.intern(v) for k, v in _load_json_resource("common", "gitignore_map.json").items()}
+)
+LICENSE_TEMPLATES = LazyJsonResource("common", "licenses.json")
 MERMAID_PROJECT_MAP = ""
@@ -24,6 +24,12 @@ from antigravity_architect.core.assimilator import AntigravityAssimilator
 import antigravity_architect.core.engine as engine
 import antigravity_architect.core.builder as builder
 import antigravity_architect.core.assimilator as assimilator  # noqa: E402
+from antigravity_architect.resources.templates import (
+    AGENT_RULES,
+    CompiledTemplate,
+    LazyJsonResource,
+    prepare_template,
+)
 
 # ==============================================================================
 # FIXTURES
@@ -172,6 +178,37 @@ class TestParseKeywords:
         assert result == ["python", "react"]
 
 
+# ==============================================================================
+# TEST: slugify_title()
+# ==============================================================================
+
+
+class TestSlugifyTitle:
+    """Tests for the slugify_title function."""
+
+    def test_strips_header_markers(self) -> None:
+        """Markdown header markers should not appear in the slug."""
+        assert AntigravityEngine.slugify_title("## My Section") == "my_section"
+
+    def test_collapses_special_characters(self) -> None:
+        """Runs of special characters should collapse to one underscore."""
+        assert AntigravityEngine.slugify_title("# C# -- Notes!!") == "c_notes"
+
+    def test_empty_becomes_untitled(self) -> None:
+        """Titles with no alphanumerics should fall back to 'untitled'."""
+        assert AntigravityEngine.slugify_title("### ***") == "untitled"
+
+    def test_truncates_to_50_chars(self) -> None:
+        """Slugs should be capped at 50 characters."""
+        assert len(AntigravityEngine.slugify_title("a" * 80)) == 50
+
+    def test_batch_matches_single(self) -> None:
+        """slugify_titles should agree with slugify_title for each title."""
+        titles = ["## My Section", "# C# -- Notes!!", "### ***", "a" * 80, "Déjà vu", "multi\nline"]
+        assert AntigravityEngine.slugify_titles(titles) == [AntigravityEngine.slugify_title(t) for t in titles]
+        assert AntigravityEngine.slugify_titles([]) == []
+
+
 # ==============================================================================
 # TEST: validate_file_path()
 # ==============================================================================
@@ -242,6 +279,16 @@ class TestIdentifyCategory:
         text = "You MUST ALWAYS follow SECURITY STANDARDS."
         assert AntigravityAssimilator.identify_category(text) == "rules"
 
+    def test_counts_repeated_keywords_on_word_boundaries(self) -> None:
+        """Repeated whole-word hits should outweigh a single hit; partial words don't count."""
+        text = "Run the deploy step, then run it again. Running tools always helps."
+        assert AntigravityAssimilator.identify_category(text) == "workflows"
+
+    def test_tie_resolves_to_earliest_category(self) -> None:
+        """On equal scores the category listed first in the rules should win, regardless of text order."""
+        text = "Use the command for this step."
+        assert AntigravityAssimilator.identify_category(text) == "workflows"
+
 
 # ==============================================================================
 # TEST: build_gitignore()
@@ -284,13 +331,103 @@ class TestBuildGitignore:
         assert "__pycache__/" in result
         assert "node_modules/" in result
 
+    def test_bytes_variant_matches_prepared_text(self) -> None:
+        """build_gitignore_bytes should equal the text version as write_file would store it."""
+        from antigravity_architect.resources.templates import GITIGNORE_MAP, prepare_template
+
+        keywords = [*GITIGNORE_MAP, "js", "unknown"]
+        expected = prepare_template(AntigravityBuilder.build_gitignore(keywords))
+        assert AntigravityBuilder.build_gitignore_bytes(keywords) == expected
+        assert AntigravityBuilder.build_gitignore_bytes([]) == prepare_template(AntigravityBuilder.build_gitignore([]))
 
 
 # ==============================================================================
-# TEST: build_tech_stack_rule()
+# TEST: CompiledTemplate
 # ==============================================================================
 
 
+class TestCompiledTemplate:
+    """Tests for the precompiled str.format-style templates."""
+
+    def test_matches_str_format(self) -> None:
+        """Rendering should be identical to str.format, including brace escapes."""
+        source = '{{"name": "{name}", "stack": "{stack}"}} {name}'
+        compiled = CompiledTemplate(source)
+        assert compiled.render(name="app", stack="python") == source.format(name="app", stack="python")
+
+    def test_missing_field_raises(self) -> None:
+        """Missing values should raise KeyError like str.format."""
+        with pytest.raises(KeyError):
+            CompiledTemplate("{project_name}").render()
+
+
+class TestLazyJsonResource:
+    """Tests for lazily parsed JSON resources such as LICENSE_TEMPLATES."""
+
+    def test_parses_on_first_access(self) -> None:
+        """The file should only be read when the mapping is first used."""
+        licenses = LazyJsonResource("common", "licenses.json")
+        assert licenses._data is None
+        assert "mit" in licenses
+        assert licenses._data is not None
+
+    def test_missing_resource_is_empty(self) -> None:
+        """A missing file should behave like an empty mapping."""
+        assert len(LazyJsonResource("common", "missing.json")) == 0
+
+    def test_compares_and_serializes_like_the_parsed_dict(self) -> None:
+        """Equality and dict conversion should see the parsed entries, not empty dict storage."""
+        import json
+
+        from antigravity_architect.resources.templates import _load_json_resource
+
+        parsed = _load_json_resource("common", "licenses.json")
+        licenses = LazyJsonResource("common", "licenses.json")
+        assert licenses == parsed
+        assert json.dumps(dict(licenses)) == json.dumps(parsed)
+
+
+class TestLazyTemplateDict:
+    """Tests for loading template directories on first access."""
+
+    def test_skills_skip_bytecode_caches(self, temp_dir: str) -> None:
+        """__pycache__ directories next to skill scripts should not become template keys."""
+        from antigravity_architect.resources.templates import LazyTemplateDict
+
+        skill_dir = Path(temp_dir) / "skills" / "bridge"
+        (skill_dir / "__pycache__").mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("# Bridge", encoding="utf-8")
+        (skill_dir / "__pycache__" / "bridge.cpython-312.pyc").write_bytes(b"\xa7\r\r\n\x00\xff")
+
+        with patch("antigravity_architect.resources.templates.TEMPLATE_BASE", Path(temp_dir)):
+            assert list(LazyTemplateDict("skills")) == ["bridge/SKILL.md"]
+
+
+class TestPreparedTemplates:
+    """Tests for the encode-once bytes view of bundled templates."""
+
+    def test_prepared_matches_write_normalisation_and_is_cached(self) -> None:
+        """prepared() should equal prepare_template(text) and return the same object each time."""
+        name = next(iter(AGENT_RULES))
+        assert AGENT_RULES.prepared(name) == prepare_template(AGENT_RULES[name])
+        assert AGENT_RULES.prepared(name) is AGENT_RULES.prepared(name)
+
+    def test_generated_licenses_match_template_text(self, temp_dir: str) -> None:
+        """LICENSE output should be the template text (MIT rendered with the year), newline-terminated."""
+        from antigravity_architect.resources.templates import LICENSE_TEMPLATES
+
+        path = os.path.join(temp_dir, "LICENSE")
+        expected = {
+            "mit": LICENSE_TEMPLATES["mit"].format(year=2024, author="pkeffect"),
+            "apache": LICENSE_TEMPLATES["apache"],
+            "unknown": LICENSE_TEMPLATES["mit"],
+        }
+        for license_type, text in expected.items():
+            AntigravityGenerator._generate_license(temp_dir, license_type, safe_mode=False, year=2024)
+            with open(path, encoding="utf-8") as f:
+                assert f.read() == text.strip() + "\n"
+
+
 class TestBuildTechStackRule:
     """Tests for the build_tech_stack_rule function."""
 
@@ -314,6 +451,19 @@ class TestBuildTechStackRule:
         assert "Tooling" in result
 
 
+class TestBuildScratchpad:
+    """Tests for the build_scratchpad function."""
+
+    def test_uses_supplied_timestamp(self) -> None:
+        """A timestamp passed in by the caller should be used verbatim."""
+        from datetime import datetime
+
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        result = AntigravityBuilder.build_scratchpad(["python"], True, now)
+        assert "*Last Updated: 2024-01-02T03:04:05*" in result
+        assert "Imported Knowledge: Yes" in result
+
+
 # ==============================================================================
 # TEST: get_destination_path()
 # ==============================================================================
@@ -410,6 +560,66 @@ class TestFileIO:
         with open(filepath) as f:
             assert f.read().strip() == "new content"
 
+    def test_write_file_bytes_written_verbatim(self, temp_dir: str) -> None:
+        """write_file should write prepared bytes without re-normalizing them."""
+        filepath = os.path.join(temp_dir, "prepared.md")
+        result = AntigravityEngine.write_file(filepath, b"  prepared\n\n")
+        assert result is True
+        with open(filepath, "rb") as f:
+            assert f.read() == b"  prepared\n\n"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permission bits")
+    def test_write_file_respects_umask(self, temp_dir: str) -> None:
+        """New files should get the default 0o666 mode filtered through the umask, as open() does."""
+        filepath = os.path.join(temp_dir, "shared.txt")
+        old_umask = os.umask(0o002)
+        try:
+            assert AntigravityEngine.write_file(filepath, "content") is True
+        finally:
+            os.umask(old_umask)
+        assert os.stat(filepath).st_mode & 0o777 == 0o664
+
+    def test_write_file_skips_equivalent_content(self, temp_dir: str) -> None:
+        """Identical bytes, or text differing only in line endings/whitespace, should not be rewritten."""
+        filepath = os.path.join(temp_dir, "same.md")
+        with open(filepath, "wb") as f:
+            f.write(b"line one\r\nline two\r\n")
+        os.utime(filepath, (0, 0))
+
+        assert AntigravityEngine.write_file(filepath, "line one\nline two") is True
+        assert AntigravityEngine.write_file(filepath, b"line one\r\nline two\r\n") is True
+        assert os.path.getmtime(filepath) == 0
+        with open(filepath, "rb") as f:
+            assert f.read() == b"line one\r\nline two\r\n"
+
+    def test_write_file_recreates_removed_cached_dir(self, temp_dir: str) -> None:
+        """write_file should recover when a previously created directory was deleted."""
+        import shutil
+
+        nested = os.path.join(temp_dir, "cached")
+        filepath = os.path.join(nested, "test.txt")
+        assert AntigravityEngine.write_file(filepath, "first") is True
+        shutil.rmtree(nested)
+        assert AntigravityEngine.write_file(filepath, "second") is True
+        with open(filepath) as f:
+            assert f.read() == "second\n"
+
+    def test_reset_dir_cache_forgets_created_dirs(self, temp_dir: str) -> None:
+        """reset_dir_cache should empty the per-process directory cache."""
+        AntigravityEngine.write_file(os.path.join(temp_dir, "cached", "a.txt"), "a")
+        assert os.path.join(temp_dir, "cached") in engine._MKDIR_CACHE
+        AntigravityEngine.reset_dir_cache()
+        assert not engine._MKDIR_CACHE
+
+    def test_write_many_writes_all_entries(self, temp_dir: str) -> None:
+        """write_many should write every entry and report results in order."""
+        entries = [(os.path.join(temp_dir, f"d{i % 3}", f"f{i}.txt"), f"content {i}") for i in range(10)]
+        results = AntigravityEngine.write_many(entries)
+        assert results == [True] * 10
+        for path, content in entries:
+            with open(path) as f:
+                assert f.read() == content + "\n"
+
     def test_create_folder_creates_directory(self, temp_dir: str) -> None:
         """create_folder should create directory with .gitkeep."""
         folderpath = os.path.join(temp_dir, "new_folder")
@@ -418,6 +628,22 @@ class TestFileIO:
         assert os.path.isdir(folderpath)
         assert os.path.exists(os.path.join(folderpath, ".gitkeep"))
 
+    def test_setup_logging_writes_file_via_listener(self, temp_dir: str) -> None:
+        """setup_logging should route file output through a listener that flushes on stop."""
+        AntigravityEngine.setup_logging(temp_dir)
+        AntigravityEngine.setup_logging(temp_dir)  # Reconfiguring replaces the previous setup
+        logging.info("queued message")
+        engine._stop_log_listener()
+        with open(os.path.join(temp_dir, "antigravity_setup.log"), encoding="utf-8") as f:
+            assert f.read().count("queued message") == 1
+
+    def test_create_folders_batch(self, temp_dir: str) -> None:
+        """create_folders should create every (deduplicated) folder with its own .gitkeep."""
+        paths = [os.path.join(temp_dir, "a", "b"), os.path.join(temp_dir, "a"), os.path.join(temp_dir, "a")]
+        assert AntigravityEngine.create_folders(paths) is True
+        for path in set(paths):
+            assert os.path.exists(os.path.join(path, ".gitkeep"))
+
     @patch("builtins.input", return_value="u")
     def test_generate_project_safe_update(self, mock_input: object, temp_dir: str) -> None:
         """generate_project should respect safe update mode when directory exists."""
@@ -485,6 +711,19 @@ class TestProcessBrainDump:
         raw_path = os.path.join(temp_dir, "context", "raw", "master_brain_dump.md")
         assert os.path.exists(raw_path)
 
+    def test_same_destination_sections_are_combined(self, temp_dir: str) -> None:
+        """Sections sharing a destination should land in one file, each framed as a separate append."""
+        filepath = os.path.join(temp_dir, "dup_dump.md")
+        with open(filepath, "w") as f:
+            f.write("# Notes\n\nFirst part.\n\n# Notes\n\nSecond part.\n")
+
+        AntigravityAssimilator.process_brain_dump(filepath, temp_dir)
+        with open(os.path.join(temp_dir, "docs", "imported", "notes.md"), encoding="utf-8") as f:
+            text = f.read()
+
+        section = "<!-- Auto-Assimilated Source -->\n\n# Notes\n\n{}"
+        assert text == f"\n\n{section.format('First part.')}\n\n\n{section.format('Second part.')}\n"
+
 
 # ==============================================================================
 # TEST: generate_agent_files()
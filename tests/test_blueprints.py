@@ -133,3 +133,20 @@ def test_generate_project_with_remote_blueprint(
 
     # Verify rules application called
     mock_apply_rules.assert_called_once()
+
+
+def test_apply_blueprint_rules_and_global_rules_write_batched(tmp_path, monkeypatch):
+    """Blueprint rules and inherited global rules should land in .agent/rules."""
+    home = tmp_path / "home"
+    (home / ".antigravity" / "rules").mkdir(parents=True)
+    (home / ".antigravity" / "rules" / "team.md").write_text("# Team", encoding="utf-8")
+    monkeypatch.setattr(Path, "home", lambda: home)
+
+    rule = next(iter(templates.AGENT_RULES))
+    base = tmp_path / "proj"
+    AntigravityGenerator._apply_blueprint_rules(str(base), {"rules": [rule, "unknown.md"]})
+    AntigravityGenerator._inherit_global_rules(str(base), safe_mode=False)
+
+    rules_dir = base / ".agent" / "rules"
+    assert sorted(p.name for p in rules_dir.iterdir()) == sorted([rule, "global_team.md"])
+    assert (rules_dir / "global_team.md").read_text(encoding="utf-8").strip() == "# Team"
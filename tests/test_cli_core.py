@@ -50,6 +50,13 @@ class TestCliCore:
         assert "test_rule.md" in overrides["rules"]
         assert overrides["rules"]["test_rule.md"] == "content"
 
+        # Case 4: Non-markdown files and directories named *.md are skipped
+        (rules_dir / "notes.txt").write_text("ignored", encoding="utf-8")
+        (rules_dir / "folder.md").mkdir()
+
+        overrides = antigravity_cli.load_custom_templates(str(templates_dir))
+        assert overrides["rules"] == {"test_rule.md": "content"}
+
     def test_doctor_check_dir_exists(self, temp_dir):
         """Test _doctor_check_dir when directory exists (lines 2184-2185)."""
         test_dir = temp_dir / "test_subdir"
@@ -61,6 +68,51 @@ class TestCliCore:
         assert issue is None
         assert fixed is None
 
+    def test_doctor_snapshot_matches_direct_checks(self, temp_dir):
+        """Snapshot-backed doctor checks should agree with per-path filesystem checks."""
+        (temp_dir / ".agent" / "rules").mkdir(parents=True)
+        (temp_dir / ".agent" / "rules" / "empty.md").write_text("", encoding="utf-8")
+        (temp_dir / "README.md").write_text("hello", encoding="utf-8")
+
+        dirs = [".agent/rules", ".agent/workflows"]
+        files = [".agent/rules/empty.md", ".agent/workflows/plan.md", "README.md"]
+        snapshot = antigravity_cli._snapshot_paths(temp_dir, dirs + files)
+
+        for d in dirs:
+            assert antigravity_cli._doctor_check_dir(temp_dir, d, False, snapshot) == antigravity_cli._doctor_check_dir(
+                temp_dir, d, False
+            )
+        for f in files:
+            with patch("builtins.print"):
+                assert antigravity_cli._doctor_check_file(
+                    temp_dir, f, None, False, snapshot=snapshot
+                ) == antigravity_cli._doctor_check_file(temp_dir, f, None, False)
+
+    def test_doctor_snapshot_keeps_case_distinct_names_apart(self, temp_dir):
+        """On a case-sensitive volume, names differing only in case are separate snapshot entries."""
+        if antigravity_cli._folds_case(temp_dir):
+            pytest.skip("temporary directory is on a case-insensitive volume")
+        (temp_dir / "README.md").write_text("upper", encoding="utf-8")
+        (temp_dir / "readme.md").write_text("", encoding="utf-8")
+
+        snapshot = antigravity_cli._snapshot_paths(temp_dir, ["README.md", "readme.md"])
+        assert snapshot == {"README.md": 5, "readme.md": 0}
+
+    def test_doctor_snapshot_defers_to_exists_on_case_insensitive_volumes(self, temp_dir, monkeypatch):
+        """Where normcase does not fold but the volume does, the doctor should stat each path instead."""
+        monkeypatch.setattr(antigravity_cli, "_folds_case", lambda directory: True)
+        monkeypatch.setattr(antigravity_cli.os.path, "normcase", lambda path: path)
+        assert antigravity_cli._snapshot_paths(temp_dir, [".agent/rules"]) is None
+
+    def test_folds_case_probes_a_case_swapped_spelling(self, temp_dir, monkeypatch):
+        """The probe should report what the volume does with a case-swapped name, not the platform."""
+        project = temp_dir / "Project"
+        project.mkdir()
+        assert antigravity_cli._folds_case(project) is (temp_dir / "pROJECT").exists()
+        monkeypatch.setattr(antigravity_cli.os.path, "samefile", lambda a, b: True)
+        assert antigravity_cli._folds_case(project) is True
+        assert antigravity_cli._folds_case(temp_dir / "123") is False  # no cased name, nothing to probe
+
     def test_doctor_project_missing_dir(self):
         """Test doctor_project with non-existent path (lines 2345-2347)."""
         assert antigravity_cli.doctor_project("/non/existent/path") is False
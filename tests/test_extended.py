@@ -49,6 +49,21 @@ def test_cli_list_commands(capsys):
     assert "Supported Tech Stack" in captured.out
 
 
+def test_cli_version_fast_path_matches_argparse(capsys):
+    """The parser-free --version output should match argparse's version action."""
+    import pytest
+
+    from antigravity_architect.cli import build_cli_parser
+
+    with pytest.raises(SystemExit) as fast_exit:
+        main(["--version"])
+    fast_out = capsys.readouterr().out
+    with pytest.raises(SystemExit) as full_exit:
+        build_cli_parser().parse_args(["--version"])
+    assert fast_out == capsys.readouterr().out
+    assert fast_exit.value.code == full_exit.value.code == 0
+
+
 def test_engine_create_error(tmp_path):
     """Test engine handling creation error."""
     # Write to a file as if it were a directory
@@ -85,3 +100,78 @@ def test_generator_safe_mode_cancel(monkeypatch, tmp_path):
     monkeypatch.setattr("builtins.input", lambda _: "c")
     res = AntigravityGenerator._handle_safe_mode("test", str(test_dir), None)
     assert res is None
+
+
+def test_no_duplicate_constant_assignments():
+    """Module and class bodies should not assign the same name twice (dead stores)."""
+    import ast
+    from pathlib import Path
+
+    import antigravity_architect
+
+    package_dir = Path(antigravity_architect.__file__).parent
+    duplicates = []
+    for source in package_dir.rglob("*.py"):
+        tree = ast.parse(source.read_text(encoding="utf-8"))
+        scopes = [tree, *(node for node in ast.walk(tree) if isinstance(node, ast.ClassDef))]
+        for scope in scopes:
+            seen = set()
+            for stmt in scope.body:
+                if isinstance(stmt, ast.Assign):
+                    names = [t.id for t in stmt.targets if isinstance(t, ast.Name)]
+                elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None and isinstance(stmt.target, ast.Name):
+                    names = [stmt.target.id]
+                else:
+                    continue
+                for name in names:
+                    if name in seen:
+                        duplicates.append(f"{source.relative_to(package_dir)}:{stmt.lineno} {name}")
+                    seen.add(name)
+    assert duplicates == []
+
+
+def test_cli_import_defers_core_modules():
+    """Importing the CLI should not load the generator stack until it is needed."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, antigravity_architect.cli as cli; "
+        "assert 'antigravity_architect.core.builder' not in sys.modules; "
+        "assert 'antigravity_architect.resources.templates' not in sys.modules; "
+        "assert cli.AntigravityGenerator.__name__ == 'AntigravityGenerator'; "
+        "assert not hasattr(cli, 'AGENT_WORKFLOWS')"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+
+
+def test_cli_main_uses_patched_generator():
+    """Patching the CLI module's generator should reach main()."""
+    from unittest import mock
+
+    with mock.patch("antigravity_architect.cli.AntigravityGenerator") as generator:
+        main(["--name", "patched-project", "--stack", "python"])
+    generator.generate_project.assert_called_once()
+    generator.generate_ecosystem_files.assert_called_once()
+
+
+def test_cli_doctor_helper_works_without_entry_point(tmp_path):
+    """Helpers that use the core classes should work when called directly after a fresh import."""
+    import subprocess
+    import sys
+
+    (tmp_path / "x.md").write_text("actual", encoding="utf-8")
+    code = (
+        "from pathlib import Path; import antigravity_architect.cli as cli; "
+        f"result = cli._doctor_check_file(Path({str(tmp_path)!r}), 'x.md', 'other', False); "
+        "assert result[1].startswith('⚠️  Drift'), result"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
@@ -116,6 +116,20 @@ class TestAdvancedFeatures:
         assert "node" in keywords  # sveltekit -> node
         assert "python" in keywords  # fastapi -> python
 
+    def test_detect_tech_stack_nested_keywords(self):
+        """Keywords contained in longer ones (docker in docker-compose) should still be detected."""
+        assimilator = AntigravityAssimilator()
+        keywords = assimilator.detect_tech_stack("Run docker-compose up for the React app.")
+        assert "docker" in keywords
+        assert "react" in keywords
+        assert "node" in keywords  # react is also an alias of node
+
+    def test_detect_tech_stack_requires_word_boundaries(self):
+        """Keywords embedded in longer words (or joined by underscores) should not count."""
+        assimilator = AntigravityAssimilator()
+        assert assimilator.detect_tech_stack("good_docker pythonic rusty") == []
+        assert sorted(assimilator.detect_tech_stack("python, rust.")) == ["python", "rust"]
+
     def test_list_keywords(self):
         """Should run list_keywords without error via main()."""
         with patch("builtins.print") as mock_print:
@@ -146,6 +160,15 @@ class TestAdvancedFeatures:
         deep_dive = assimilator.build_tech_deep_dive([], "Just some text.")
         assert "Standard project structure" in deep_dive
 
+    def test_lower_variants_match_public_scanners(self):
+        """Pre-lowered entry points should agree with the ones that lowercase themselves."""
+        text = "TODO: move the Django API to Docker and add SQL auth."
+        keywords = AntigravityAssimilator.detect_tech_stack(text)
+        assert sorted(AntigravityAssimilator.detect_tech_stack_lower(text.lower())) == sorted(keywords)
+        assert AntigravityAssimilator.build_tech_deep_dive_lower(
+            keywords, text.lower()
+        ) == AntigravityAssimilator.build_tech_deep_dive(keywords, text)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
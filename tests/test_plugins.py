@@ -89,3 +89,29 @@ class TestPlugins:
         
         # Conditional plugins (Gitea) should NOT execute when missing keywords
         assert not os.path.exists(os.path.join(temp_project_dir, ".gitea"))
+
+
+class TestGitignoreMapDrift:
+    def test_plugin_dirs_match_gitignore_entries(self) -> None:
+        """The literal GITIGNORE_MAP entries must stay in sync with the plugin directory constants."""
+        from antigravity_architect.resources.templates import GITIGNORE_MAP
+
+        PluginManager.load_plugins()
+        plugins = PluginManager._plugins
+        assert plugins["ag_plugin_vscode"].VSCODE_DIR + "/" in GITIGNORE_MAP["vscode"]
+        assert plugins["ag_plugin_gitea"].GITEA_DIR + "/" in GITIGNORE_MAP["gitea"]
+
+
+class TestCachedPluginBuilders:
+    def test_keyword_order_does_not_change_output(self) -> None:
+        """Cached nix/vscode builders key on the keyword set and hand back independent copies."""
+        PluginManager.load_plugins()
+        plugins = PluginManager._plugins
+        idx, vscode = plugins["ag_plugin_idx"], plugins["ag_plugin_vscode"]
+
+        assert idx.build_nix_config(["python", "docker"]) == idx.build_nix_config(["docker", "python", "python"])
+
+        files = vscode.build_vscode_config(["python", "react"])
+        assert files == vscode.build_vscode_config(["react", "python"])
+        files["extensions.json"] = "mutated"
+        assert vscode.build_vscode_config(["python", "react"])["extensions.json"] != "mutated"